@@ -0,0 +1,19 @@
+"""Import the integration's API module without Home Assistant installed."""
+
+import importlib.util
+from pathlib import Path
+
+_API_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "hisense"
+    / "pyhisenseapi.py"
+)
+
+
+def load_api():
+    """Load ``pyhisenseapi`` by path; the package ``__init__`` needs Home Assistant."""
+    spec = importlib.util.spec_from_file_location("pyhisenseapi", _API_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,82 @@
+"""Import cost of the entity platforms forwarded for each kind of entry.
+
+Every case imports the integration in a fresh interpreter and then times the
+platform modules its entry forwards, including the Home Assistant entity
+components they pull in, and prints the best wall time and the memory they
+allocate. Needs Home Assistant installed.
+
+    python benchmarks/bench_platform_import.py
+"""
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+REPEAT = 5
+ROOT = Path(__file__).resolve().parent.parent
+
+# The platforms every entry forwarded before they depended on its devices.
+ALL_PLATFORMS = ("climate", "switch", "button", "number", "sensor", "select")
+
+_PROBE = """
+import importlib, json, sys, time, tracemalloc
+importlib.import_module("custom_components.hisense")
+tracemalloc.start()
+started = time.perf_counter()
+for platform in sys.argv[1:]:
+    importlib.import_module(f"custom_components.hisense.{platform}")
+elapsed = time.perf_counter() - started
+print(json.dumps({"seconds": elapsed, "bytes": tracemalloc.get_traced_memory()[0]}))
+"""
+
+
+def _platform_cases():
+    sys.path.insert(0, str(ROOT / "custom_components" / "hisense"))
+    # const only imports Home Assistant inside its helpers.
+    from const import platforms_for_devices
+
+    return {
+        "all platforms (before)": list(ALL_PLATFORMS),
+        "AC only": platforms_for_devices([{"device_type": "空调"}]),
+        "fridge only": platforms_for_devices([{"device_type": "冰箱"}]),
+        "AC and fridge": platforms_for_devices(
+            [{"device_type": "空调"}, {"device_type": "冰箱"}]
+        ),
+    }
+
+
+def _measure(platforms):
+    best = None
+    for _ in range(REPEAT):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE, *platforms],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output)
+        if best is None or result["seconds"] < best["seconds"]:
+            best = result
+    return best
+
+
+def main():
+    try:
+        import homeassistant  # noqa: F401
+    except ImportError:
+        print("Home Assistant is not installed, nothing to measure", file=sys.stderr)
+        return 1
+    print(f"{'entry':<24}{'platforms':>10}{'ms':>10}{'KiB':>10}")
+    for name, platforms in _platform_cases().items():
+        result = _measure(platforms)
+        print(
+            f"{name:<24}{len(platforms):>10}{result['seconds'] * 1000:>10.1f}"
+            f"{result['bytes'] / 1024:>10.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Micro-benchmark of the selective status decoder.
+
+Compares the selective decoder against converting every field of the payload,
+which is what the decoders did before, and prints the cost per response.
+
+    python benchmarks/bench_status_decoder.py
+"""
+
+import timeit
+import tracemalloc
+
+from _loader import load_api
+from payloads import AC_STATUS, FRIDGE_STATUS
+
+api = load_api()
+
+NUMBER = 20000
+REPEAT = 5
+
+
+def _decode_full_list(payload, indices, min_fields):
+    """Reference decoder: convert every field, then pick the ones needed."""
+    values = [int(i.strip()) for i in payload.split(",")]
+    if len(values) < min_fields:
+        raise ValueError("short payload")
+    return [values[index] if index < len(values) else 0 for index in indices]
+
+
+def _update_fresh(client, payload):
+    """Decode as if the payload differed from the previous one."""
+    client._last_payload = None
+    return client._update_status_from_payload(payload)
+
+
+def _per_call_us(func):
+    best = min(timeit.repeat(func, number=NUMBER, repeat=REPEAT))
+    return best / NUMBER * 1e6
+
+
+def _allocated_bytes(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    # Each response carries a new string, so compare equal but distinct objects.
+    ac_repeat = (AC_STATUS + ",")[:-1]
+    fridge_repeat = (FRIDGE_STATUS + ",")[:-1]
+    ac = api.HiSenseAC("wifi", "device", "token", session=None)
+    fridge = api.HiSenseFridge("wifi", "device", "token", session=None)
+    cases = [
+        (
+            "AC full list",
+            lambda: _decode_full_list(
+                AC_STATUS, api._AC_STATUS_DECODER.indices, api._MIN_STATUS_VALUES
+            ),
+        ),
+        (
+            "AC selective",
+            lambda: api._decode_status_fields(
+                AC_STATUS, api._AC_STATUS_DECODER.indices, api._MIN_STATUS_VALUES
+            ),
+        ),
+        ("AC status update", lambda: _update_fresh(ac, AC_STATUS)),
+        ("AC unchanged payload", lambda: ac._update_status_from_payload(ac_repeat)),
+        (
+            "fridge full list",
+            lambda: _decode_full_list(
+                FRIDGE_STATUS, api._FRIDGE_STATUS_DECODER.indices, api._MIN_FRIDGE_STATUS_VALUES
+            ),
+        ),
+        (
+            "fridge selective",
+            lambda: api._decode_status_fields(
+                FRIDGE_STATUS, api._FRIDGE_STATUS_DECODER.indices, api._MIN_FRIDGE_STATUS_VALUES
+            ),
+        ),
+        ("fridge status update", lambda: _update_fresh(fridge, FRIDGE_STATUS)),
+        (
+            "fridge unchanged",
+            lambda: fridge._update_status_from_payload(fridge_repeat),
+        ),
+    ]
+    print(f"{'case':<24}{'us/response':>12}{'peak bytes':>12}")
+    for name, func in cases:
+        print(f"{name:<24}{_per_call_us(func):>12.2f}{_allocated_bytes(func):>12}")
+
+
+if __name__ == "__main__":
+    main()
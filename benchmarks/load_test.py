@@ -0,0 +1,223 @@
+"""Load test of the Hisense clients against the local mock cloud.
+
+Starts ``mock_cloud`` in process (or uses ``--url`` for one started
+separately), points one account with N simulated devices at it and reports
+latency percentiles and throughput for polls and commands as JSON.
+
+    python benchmarks/load_test.py --devices 300 --latency 0.05 --error-rate 0.01
+    python benchmarks/load_test.py --devices 50 --token-lifetime 2 --duration 10
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+
+import aiohttp
+
+from _loader import load_api
+from mock_cloud import (
+    API_PREFIX,
+    HOME_DEVICE_LIST_PATH,
+    HOME_ID,
+    REFRESH_PATH,
+    add_arguments,
+    cloud_from_args,
+    start_mock_cloud,
+)
+
+api = load_api()
+
+# (cmdId, parameter range) of the logic commands the workers send.
+AC_COMMANDS = ((6, (18, 30)), (1, (0, 4)), (62, (0, 3)))
+FRIDGE_COMMANDS = ((1, (2, 8)), (2, (-24, -16)))
+
+
+def _percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(latencies, failures, elapsed):
+    """Return count, throughput and p50/p95/p99 latency in milliseconds."""
+    latencies = sorted(latencies)
+    total = len(latencies) + failures
+    return {
+        "count": total,
+        "failures": failures,
+        "throughput_per_sec": round(total / elapsed, 1) if elapsed else None,
+        "p50_ms": _ms(_percentile(latencies, 50)),
+        "p95_ms": _ms(_percentile(latencies, 95)),
+        "p99_ms": _ms(_percentile(latencies, 99)),
+    }
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+async def _fetch_devices(session, base_url):
+    """List the simulated devices the way the config flow discovers them."""
+    params = {"accessToken": "", "homeId": HOME_ID}
+    for _ in range(5):
+        async with session.get(
+            f"{base_url}{HOME_DEVICE_LIST_PATH}", params=params
+        ) as response:
+            if response.status != 200:
+                continue
+            result = await response.json()
+        if result["response"]["resultCode"] == 0:
+            return result["response"]["deviceList"]
+    raise RuntimeError("mock cloud refused the device list")
+
+
+def _make_clients(session, base_url, devices):
+    account = api.HiSenseAccount(session, "mock-refresh-token")
+    account.refresh_url = f"{base_url}{REFRESH_PATH}"
+    for device in devices:
+        client_class = api.HiSenseFridge if device["deviceTypeName"] == "冰箱" else api.HiSenseAC
+        client = client_class(
+            device["wifiId"], device["deviceId"], "mock-refresh-token", session
+        )
+        client.url_head = f"{base_url}{API_PREFIX}"
+        client.power_url = f"{client.url_head}/sendDeviceModelCmd?accessToken="
+        client.command_url = f"{client.url_head}/uploadRemoteLogicCmd?accessToken="
+        client.check_url = f"{client.url_head}/getDeviceLogicalStatusArray?accessToken="
+        client.refresh_url = account.refresh_url
+        account.add_client(client)
+    return account
+
+
+async def _run_workers(workers, duration, operation):
+    """Run ``operation(worker)`` in a loop on every worker for ``duration`` seconds."""
+    latencies = []
+    failures = 0
+    deadline = time.perf_counter() + duration
+
+    async def loop(worker):
+        nonlocal failures
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                ok = await operation(worker)
+            except Exception:
+                ok = False
+            if ok:
+                latencies.append(time.perf_counter() - started)
+            else:
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(loop(worker) for worker in workers))
+    return summarize(latencies, failures, time.perf_counter() - started)
+
+
+async def _command(client, rng):
+    commands = FRIDGE_COMMANDS if isinstance(client, api.HiSenseFridge) else AC_COMMANDS
+    cmd_id, (low, high) = rng.choice(commands)
+    return await client.send_logic_command(cmd_id, rng.randint(low, high))
+
+
+async def run(args, base_url, cloud=None):
+    rng = random.Random(args.seed)
+    report = {"devices": 0, "scenarios": {}}
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=args.connections)
+    ) as session:
+        devices = await _fetch_devices(session, base_url)
+        account = _make_clients(session, base_url, devices)
+        scheduler = account.scheduler
+        if args.max_concurrency is not None:
+            scheduler.max_concurrency = args.max_concurrency
+        if args.rate is not None:
+            scheduler.rate = scheduler.burst = args.rate
+        clients = list(account.clients.values())
+        report["devices"] = len(clients)
+        for _ in range(5):
+            if await account.refresh():
+                break
+        else:
+            raise RuntimeError("mock cloud refused the token refresh")
+
+        scenarios = report["scenarios"]
+        scenarios["poll_account_batch"] = await _run_workers(
+            range(args.pollers),
+            args.duration,
+            lambda _: _batch_poll(account, len(clients)),
+        )
+        scenarios["poll_per_device"] = await _run_workers(
+            clients, args.duration, lambda client: client.check_status()
+        )
+        scenarios["command"] = await _run_workers(
+            range(args.concurrency),
+            args.duration,
+            lambda _: _command(rng.choice(clients), rng),
+        )
+    report["scheduler"] = scheduler.as_dict()
+    if cloud is not None:
+        report["server_requests"] = dict(sorted(cloud.request_counts.items()))
+    return report
+
+
+async def _batch_poll(account, device_count):
+    # Concurrent pollers join the batch in flight; a partial answer counts as failed.
+    updated = await account.check_all()
+    return len(updated) == device_count
+
+
+async def _main(args):
+    if args.url:
+        return await run(args, args.url.rstrip("/"))
+    cloud = cloud_from_args(args)
+    runner, base_url = await start_mock_cloud(cloud)
+    try:
+        return await run(args, base_url, cloud)
+    finally:
+        await runner.cleanup()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    parser.add_argument("--url", help="use a mock cloud already running at this URL")
+    parser.add_argument(
+        "--duration", type=float, default=5.0, help="seconds per scenario"
+    )
+    parser.add_argument(
+        "--pollers", type=int, default=4, help="concurrent account batch pollers"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=16, help="concurrent command senders"
+    )
+    parser.add_argument(
+        "--connections", type=int, default=100, help="HTTP connection pool size"
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        help="requests in flight per account (default: the client's scheduler default)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        help="requests per second per account (default: the client's scheduler default)",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="show the client log, including injected failures"
+    )
+    args = parser.parse_args(argv)
+    if not args.verbose:
+        logging.getLogger(api.__name__).setLevel(logging.CRITICAL)
+    report = asyncio.run(_main(args))
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
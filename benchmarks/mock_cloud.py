@@ -0,0 +1,321 @@
+"""Local mock of the Hisense cloud endpoints used by the integration.
+
+Emulates token refresh, status polling, logic and power commands and the home
+and device listing endpoints, keeping a mutable status array per device.
+Latency, error rate and token lifetime are configurable so the clients can be
+load tested without touching the real cloud.
+
+    python benchmarks/mock_cloud.py --devices 200 --latency 0.05 --error-rate 0.01
+"""
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import itertools
+import random
+import time
+
+from aiohttp import web
+
+from payloads import AC_STATUS, FRIDGE_STATUS
+
+API_PREFIX = "/agw/dsg/outer"
+REFRESH_PATH = "/aaa/refresh_token2"
+HOME_LIST_PATH = "/wg/dm/getHomeList"
+HOME_DEVICE_LIST_PATH = "/wg/dm/getHomeDeviceList"
+HOME_ID = "mock-home"
+
+# resultCode returned for injected application-level failures.
+SERVER_ERROR_CODE = 1
+# resultCode returned for a rejected access token with --token-error body. The
+# real cloud's code is not known; the clients treat every non-zero code alike.
+TOKEN_ERROR_CODE = 2
+
+# cmdId -> status index for logic commands.
+AC_LOGIC_COMMANDS = {1: 0, 3: 4, 6: 9, 28: 45, 41: 58, 62: 209}
+FRIDGE_LOGIC_COMMANDS = {1: 0, 2: 1}
+# Fridge mode commands set a mode field to a fixed value: cmdId -> (index, value).
+FRIDGE_MODE_COMMANDS = {
+    19: (3, 64),
+    25: (3, 65),
+    33: (130, 64),
+    34: (130, 32),
+    35: (130, 16),
+}
+AC_POWER_INDEX = 5
+FRIDGE_POWER_INDEX = 4
+
+
+@dataclass
+class MockDevice:
+    """One simulated device."""
+
+    device_id: str
+    wifi_id: str
+    kind: str
+    status: list[int] = field(default_factory=list)
+
+    @property
+    def status_string(self):
+        return ",".join(map(str, self.status))
+
+
+@dataclass
+class MockCloudConfig:
+    """Behaviour knobs of the mock cloud."""
+
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    token_lifetime: float = 3600.0
+    # How a rejected token is answered: "body" (HTTP 200 with a non-zero
+    # resultCode) or "http" (HTTP 401).
+    token_error: str = "body"
+
+
+class MockHisenseCloud:
+    """aiohttp application emulating the Hisense cloud."""
+
+    def __init__(self, config=None, seed=None):
+        self.config = config or MockCloudConfig()
+        self.devices = {}
+        self.tokens = {}
+        self.request_counts = {}
+        self._random = random.Random(seed)
+        self._token_ids = itertools.count(1)
+
+    def add_devices(self, count, fridge_ratio=0.2):
+        """Create ``count`` devices, a ``fridge_ratio`` share of them fridges."""
+        start = len(self.devices)
+        for number in range(start, start + count):
+            kind = "fridge" if self._random.random() < fridge_ratio else "ac"
+            payload = FRIDGE_STATUS if kind == "fridge" else AC_STATUS
+            device = MockDevice(
+                device_id=f"mock-{kind}-{number:05d}",
+                wifi_id=f"mock-wifi-{number:05d}",
+                kind=kind,
+                status=[int(value) for value in payload.split(",")],
+            )
+            self.devices[device.device_id] = device
+        return list(self.devices.values())[start:]
+
+    def issue_token(self):
+        token = f"mock-token-{next(self._token_ids)}"
+        self.tokens[token] = time.monotonic()
+        return token
+
+    def expire_tokens(self):
+        """Invalidate every issued access token."""
+        self.tokens.clear()
+
+    def make_app(self):
+        app = web.Application()
+        app.router.add_post(REFRESH_PATH, self._refresh)
+        app.router.add_post(f"{API_PREFIX}/getDeviceLogicalStatusArray", self._status)
+        app.router.add_post(f"{API_PREFIX}/uploadRemoteLogicCmd", self._logic_command)
+        app.router.add_post(f"{API_PREFIX}/sendDeviceModelCmd", self._power_command)
+        app.router.add_get(HOME_LIST_PATH, self._home_list)
+        app.router.add_get(HOME_DEVICE_LIST_PATH, self._home_device_list)
+        return app
+
+    async def _simulate(self, request):
+        """Count the request, apply latency and decide whether to inject a failure."""
+        path = request.path
+        self.request_counts[path] = self.request_counts.get(path, 0) + 1
+        config = self.config
+        if config.latency or config.latency_jitter:
+            delay = config.latency + self._random.uniform(0, config.latency_jitter)
+            await asyncio.sleep(delay)
+        if config.error_rate and self._random.random() < config.error_rate:
+            if self._random.random() < 0.5:
+                raise web.HTTPInternalServerError(text="injected failure")
+            return False
+        return True
+
+    def _token_valid(self, request):
+        token = request.query.get("accessToken")
+        issued = self.tokens.get(token)
+        return issued is not None and time.monotonic() - issued < self.config.token_lifetime
+
+    def _reject_token(self):
+        if self.config.token_error == "http":
+            raise web.HTTPUnauthorized(text="invalid access token")
+        return self._error(TOKEN_ERROR_CODE)
+
+    @staticmethod
+    def _error(result_code):
+        return web.json_response(
+            {"response": {"resultCode": result_code, "errorDesc": "mock error"}}
+        )
+
+    async def _refresh(self, request):
+        await request.post()
+        if not await self._simulate(request):
+            return web.json_response([])
+        return web.json_response([{"token": self.issue_token()}])
+
+    async def _status(self, request):
+        body = await request.json()
+        if not await self._simulate(request):
+            return self._error(SERVER_ERROR_CODE)
+        if not self._token_valid(request):
+            return self._reject_token()
+        status_list = []
+        for entry in body.get("deviceList", []):
+            device = self.devices.get(entry.get("deviceId"))
+            if device is None:
+                continue
+            status_list.append(
+                {
+                    "wifiId": device.wifi_id,
+                    "deviceId": device.device_id,
+                    "deviceStatus": device.status_string,
+                }
+            )
+        return web.json_response(
+            {"response": {"resultCode": 0, "deviceStatusList": status_list}}
+        )
+
+    async def _logic_command(self, request):
+        body = await request.json()
+        if not await self._simulate(request):
+            return self._error(SERVER_ERROR_CODE)
+        if not self._token_valid(request):
+            return self._reject_token()
+        device = self.devices.get(body.get("deviceId"))
+        if device is None:
+            return self._error(SERVER_ERROR_CODE)
+        commands = sorted(body.get("cmdList", []), key=lambda cmd: cmd.get("cmdOrder", 0))
+        for command in commands:
+            cmd_id = command.get("cmdId")
+            param = command.get("cmdParm")
+            if device.kind == "ac" and cmd_id in AC_LOGIC_COMMANDS:
+                device.status[AC_LOGIC_COMMANDS[cmd_id]] = param
+            elif device.kind == "fridge" and cmd_id in FRIDGE_LOGIC_COMMANDS:
+                device.status[FRIDGE_LOGIC_COMMANDS[cmd_id]] = param
+            elif device.kind == "fridge" and cmd_id in FRIDGE_MODE_COMMANDS:
+                index, value = FRIDGE_MODE_COMMANDS[cmd_id]
+                device.status[index] = value
+        return web.json_response(
+            {"response": {"resultCode": 0, "preStatus": device.status_string}}
+        )
+
+    async def _power_command(self, request):
+        body = await request.json()
+        if not await self._simulate(request):
+            return self._error(SERVER_ERROR_CODE)
+        if not self._token_valid(request):
+            return self._reject_token()
+        device = self.devices.get(body.get("deviceId"))
+        if device is None:
+            return self._error(SERVER_ERROR_CODE)
+        power_on = "\"On\"" in body.get("attributes", "")
+        index = FRIDGE_POWER_INDEX if device.kind == "fridge" else AC_POWER_INDEX
+        device.status[index] = 1 if power_on else 0
+        # The real endpoint acknowledges without a status payload.
+        return web.json_response({"response": {"resultCode": 0}})
+
+    async def _home_list(self, request):
+        if not await self._simulate(request):
+            return self._error(SERVER_ERROR_CODE)
+        return web.json_response(
+            {
+                "response": {
+                    "resultCode": 0,
+                    "homeList": [{"homeId": HOME_ID, "homeName": "Mock home"}],
+                }
+            }
+        )
+
+    async def _home_device_list(self, request):
+        if not await self._simulate(request):
+            return self._error(SERVER_ERROR_CODE)
+        device_list = [
+            {
+                "deviceId": device.device_id,
+                "wifiId": device.wifi_id,
+                "deviceTypeName": "冰箱" if device.kind == "fridge" else "空调",
+                "deviceName": device.kind,
+                "deviceNickName": device.device_id,
+                "roomName": "",
+                "deviceCode": device.device_id,
+            }
+            for device in self.devices.values()
+        ]
+        return web.json_response(
+            {"response": {"resultCode": 0, "deviceList": device_list}}
+        )
+
+
+async def start_mock_cloud(cloud, host="127.0.0.1", port=0):
+    """Serve ``cloud`` and return (runner, base_url)."""
+    runner = web.AppRunner(cloud.make_app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://{host}:{bound_port}"
+
+
+def add_arguments(parser):
+    """Add the mock cloud knobs to an argument parser."""
+    parser.add_argument("--devices", type=int, default=100, help="simulated devices")
+    parser.add_argument(
+        "--fridge-ratio", type=float, default=0.2, help="share of devices that are fridges"
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="base latency in seconds")
+    parser.add_argument(
+        "--latency-jitter", type=float, default=0.0, help="extra random latency in seconds"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="share of requests that fail"
+    )
+    parser.add_argument(
+        "--token-lifetime", type=float, default=3600.0, help="access token lifetime in seconds"
+    )
+    parser.add_argument(
+        "--token-error",
+        choices=("body", "http"),
+        default="body",
+        help="answer a rejected token with a resultCode in the body or with HTTP 401",
+    )
+    parser.add_argument("--seed", type=int, help="random seed")
+
+
+def cloud_from_args(args):
+    cloud = MockHisenseCloud(
+        MockCloudConfig(
+            latency=args.latency,
+            latency_jitter=args.latency_jitter,
+            error_rate=args.error_rate,
+            token_lifetime=args.token_lifetime,
+            token_error=args.token_error,
+        ),
+        seed=args.seed,
+    )
+    cloud.add_devices(args.devices, args.fridge_ratio)
+    return cloud
+
+
+async def _serve(args):
+    cloud = cloud_from_args(args)
+    runner, base_url = await start_mock_cloud(cloud, port=args.port)
+    print(f"Mock Hisense cloud with {len(cloud.devices)} devices on {base_url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    parser.add_argument("--port", type=int, default=8080)
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
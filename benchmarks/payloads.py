@@ -0,0 +1,60 @@
+"""Representative Hisense status payloads for the benchmarks.
+
+The values follow the field layout decoded by ``pyhisenseapi``: a running AC
+cooling to 26 °C at 27 °C indoors, and a fridge in custom mode with a
+variation zone set to 0 °C fresh keeping.
+"""
+
+
+def _payload(field_count, values):
+    fields = ["0"] * field_count
+    for index, value in values.items():
+        fields[index] = str(value)
+    return ",".join(fields)
+
+
+AC_STATUS = _payload(
+    214,
+    {
+        0: 3,
+        4: 2,
+        5: 1,
+        9: 26,
+        10: 27,
+        11: 50,
+        13: 1,
+        44: 0,
+        45: 0,
+        58: 1,
+        64: 16,
+        65: 32,
+        120: 255,
+        209: 1,
+    },
+)
+
+FRIDGE_STATUS = _payload(
+    142,
+    {
+        0: 5,
+        1: -18,
+        3: 0,
+        4: 1,
+        6: 4,
+        7: -19,
+        8: 0,
+        9: 24,
+        20: 1,
+        130: 32,
+    },
+)
+
+
+def status_response(payload):
+    """Wrap a status payload like a getDeviceLogicalStatusArray response."""
+    return {
+        "response": {
+            "resultCode": 0,
+            "deviceStatusList": [{"deviceStatus": payload}],
+        }
+    }
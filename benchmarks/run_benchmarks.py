@@ -0,0 +1,232 @@
+"""Benchmark suite for the pyhisenseapi hot paths.
+
+Prints ops/sec and allocations per op as JSON and optionally compares them
+with a stored baseline, failing when a case got slower than the tolerance.
+
+    python benchmarks/run_benchmarks.py
+
+Baselines are machine specific, so none is committed. Save one from the
+commit to compare against on the machine doing the comparison, then run
+the changed tree against it:
+
+    python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from _loader import load_api
+from payloads import AC_STATUS, FRIDGE_STATUS, status_response
+
+api = load_api()
+
+DEFAULT_TOLERANCE = 0.25
+# Each case is timed REPEAT times for about MIN_SECONDS; the best run counts,
+# which keeps scheduler noise out of the comparison.
+MIN_SECONDS = 0.2
+REPEAT = 5
+
+
+def _allocated_bytes(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def _measure_sync(func):
+    """Return (ops/sec, peak bytes allocated per op) for a synchronous case."""
+    func()
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - started >= MIN_SECONDS:
+            break
+        number *= 2
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - started)
+    return number / best, _allocated_bytes(func)
+
+
+async def _measure_async(func, number):
+    """Return (ops/sec, peak bytes allocated per op) for a request case."""
+    await func()
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        for _ in range(number):
+            await func()
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    await func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return number / best, peak
+
+
+def _update_status(client, response):
+    return client._update_status_from_payload(client._extract_status_payload(response))
+
+
+def _fresh_update(client, response):
+    client._last_payload = None
+    return _update_status(client, response)
+
+
+def sync_cases():
+    ac = api.HiSenseAC("wifi", "ac", "token", session=None)
+    fridge = api.HiSenseFridge("wifi", "fridge", "token", session=None)
+    ac_response = status_response(AC_STATUS)
+    fridge_response = status_response(FRIDGE_STATUS)
+    return {
+        "ac_update_status": lambda: _fresh_update(ac, ac_response),
+        "fridge_update_status": lambda: _fresh_update(fridge, fridge_response),
+        "ac_unchanged_status": lambda: _update_status(
+            ac, status_response((AC_STATUS + ",")[:-1])
+        ),
+        "extract_status_payload": lambda: ac._extract_status_payload(ac_response),
+        "logic_command_body": lambda: _logic_command_body(ac),
+        "power_command_body": lambda: _power_command_body(ac),
+    }
+
+
+def _logic_command_body(client):
+    return client._command_body([(6, 26)])
+
+
+def _power_command_body(client):
+    return client._power_body(True)
+
+
+async def async_cases(number):
+    """Run ``_send_request`` against an in-process aiohttp stub of the cloud."""
+    try:
+        import aiohttp
+        from aiohttp import web
+    except ImportError:
+        print("aiohttp is not installed, skipping request benchmarks", file=sys.stderr)
+        return {}
+
+    check_body = json.dumps(status_response(AC_STATUS))
+    command_body = json.dumps({"response": {"resultCode": 0, "preStatus": AC_STATUS}})
+
+    async def check(request):
+        await request.read()
+        return web.Response(text=check_body, content_type="application/json")
+
+    async def command(request):
+        await request.read()
+        return web.Response(text=command_body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_post("/check", check)
+    app.router.add_post("/command", command)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    base = f"http://127.0.0.1:{port}"
+
+    results = {}
+    try:
+        async with aiohttp.ClientSession() as session:
+            client = api.HiSenseAC("wifi", "ac", "token", session=session)
+            client.access_token = "token"
+
+            async def send_check():
+                client._last_payload = None
+                return await client._send_request(
+                    f"{base}/check?accessToken=", client._check_body
+                )
+
+            async def send_logic():
+                client._last_payload = None
+                return await client._send_request(
+                    f"{base}/command?accessToken=",
+                    client._command_body([(6, 26)]),
+                    status_required=False,
+                )
+
+            for name, func in (
+                ("send_request_check", send_check),
+                ("send_request_logic", send_logic),
+            ):
+                results[name] = await _measure_async(func, number)
+    finally:
+        await runner.cleanup()
+    return results
+
+
+def run(request_count):
+    results = {}
+    for name, func in sync_cases().items():
+        ops, allocated = _measure_sync(func)
+        results[name] = {"ops_per_sec": round(ops, 1), "bytes_per_op": allocated}
+    for name, (ops, allocated) in asyncio.run(async_cases(request_count)).items():
+        results[name] = {"ops_per_sec": round(ops, 1), "bytes_per_op": allocated}
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(report, baseline, tolerance):
+    """Return the cases that are slower than ``baseline`` by more than ``tolerance``."""
+    regressions = []
+    for name, result in report["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            continue
+        ratio = result["ops_per_sec"] / reference["ops_per_sec"]
+        result["vs_baseline"] = round(ratio, 3)
+        if ratio < 1 - tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", help="compare against this baseline JSON file")
+    parser.add_argument("--save-baseline", help="write the results to this file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="allowed slowdown before a case counts as a regression (default 0.25)",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=200, help="requests per stub-server run"
+    )
+    args = parser.parse_args(argv)
+
+    report = run(args.requests)
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare(report, json.load(file), args.tolerance)
+        report["regressions"] = regressions
+    print(json.dumps(report, indent=2))
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+            file.write("\n")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,87 @@
+import asyncio
+from datetime import timedelta
+import logging
+import time
+
 from homeassistant import config_entries, core
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN
+from .const import (
+    CONF_AC_TEMPERATURE_HOLD,
+    CONF_ADAPTIVE_POLLING,
+    CONF_FRIDGE_TEMPERATURE_HOLD,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_SETUP_CONCURRENCY,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_TEMPERATURE_FILTER,
+    DEFAULT_AC_TEMPERATURE_HOLD,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_FRIDGE_TEMPERATURE_HOLD,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_SETUP_CONCURRENCY,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DEFAULT_TEMPERATURE_FILTER,
+    DOMAIN,
+    platforms_for_devices,
+)
 from .coordinator import HisenseDataUpdateCoordinator
-from .pyhisenseapi import HiSenseAC, HiSenseFridge
+from .pyhisenseapi import HiSenseAC, HiSenseAccount, HiSenseFridge
+from .store import HisenseStore
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def _async_first_refresh(
+    coordinator: HisenseDataUpdateCoordinator, semaphore: asyncio.Semaphore
+) -> bool:
+    """Run one device's first refresh without failing the whole entry."""
+    async with semaphore:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady as err:
+            _LOGGER.warning(
+                "Hisense device %s is not ready yet: %s", coordinator.client.device_id, err
+            )
+            return False
+    return True
+
+
+async def _async_background_refresh(
+    coordinator: HisenseDataUpdateCoordinator, semaphore: asyncio.Semaphore
+) -> None:
+    """Replace a restored status with a live one once setup is done."""
+    async with semaphore:
+        await coordinator.async_refresh()
 
 
 async def async_setup_entry(hass: core.HomeAssistant, entry: config_entries.ConfigEntry):
+    setup_started = time.monotonic()
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {}
+    coordinators = hass.data[DOMAIN][entry.entry_id] = {}
     session = async_get_clientsession(hass)
+    store = HisenseStore(hass, entry.entry_id)
+    await store.async_load()
+    store_loaded = time.monotonic()
+    accounts = {}
+    adaptive_polling = entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
+    temperature_filter = entry.options.get(
+        CONF_TEMPERATURE_FILTER, DEFAULT_TEMPERATURE_FILTER
+    )
+    min_publish_interval = entry.options.get(
+        CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL
+    )
+    temperature_deadband = entry.options.get(
+        CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+    )
+    ac_temperature_hold = timedelta(
+        minutes=entry.options.get(CONF_AC_TEMPERATURE_HOLD, DEFAULT_AC_TEMPERATURE_HOLD)
+    )
+    fridge_temperature_hold = timedelta(
+        minutes=entry.options.get(
+            CONF_FRIDGE_TEMPERATURE_HOLD, DEFAULT_FRIDGE_TEMPERATURE_HOLD
+        )
+    )
     for device_info in entry.data["devices"]:
         device_id = device_info["device_id"]
         wifi_id = device_info["wifi_id"]
@@ -41,20 +113,91 @@ async def async_setup_entry(hass: core.HomeAssistant, entry: config_entries.Conf
                 entity_name=entity_name
             )
 
-        coordinator = HisenseDataUpdateCoordinator(hass, client, device_type)
-        await coordinator.async_config_entry_first_refresh()
-        hass.data[DOMAIN][entry.entry_id][device_id] = coordinator
+        account = accounts.get(refresh_token)
+        if account is None:
+            account = accounts[refresh_token] = HiSenseAccount(session, refresh_token)
+            # A cached token lets the first poll skip the refresh round trip;
+            # if the cloud rejects it the normal retry path refreshes it.
+            store.restore_account(account)
+            store.async_track_account(account)
+        account.add_client(client)
+        coordinator = coordinators[device_id] = HisenseDataUpdateCoordinator(
+            hass,
+            client,
+            device_type,
+            account=account,
+            peers=coordinators,
+            adaptive_polling=adaptive_polling,
+            temperature_filter=temperature_filter,
+            min_publish_interval=min_publish_interval,
+            temperature_deadband=temperature_deadband,
+            temperature_hold=(
+                fridge_temperature_hold if device_type == "冰箱" else ac_temperature_hold
+            ),
+        )
+        store.restore_status(coordinator)
+        entry.async_on_unload(store.async_track_status(coordinator))
+
+    # Every client is registered before the first refresh so concurrent first
+    # refreshes join the same batch status poll. A device that fails keeps its
+    # coordinator and recovers on a later poll instead of blocking the others.
+    # Devices with a status restored from disk are shown right away, marked
+    # stale, and fetched in the background instead of holding up the setup.
+    semaphore = asyncio.Semaphore(
+        entry.options.get(CONF_SETUP_CONCURRENCY, DEFAULT_SETUP_CONCURRENCY)
+    )
+    restored = [c for c in coordinators.values() if c.stale]
+    for coordinator in restored:
+        entry.async_create_background_task(
+            hass,
+            _async_background_refresh(coordinator, semaphore),
+            f"{DOMAIN}_refresh_{coordinator.client.device_id}",
+        )
+    results = await asyncio.gather(
+        *(
+            _async_first_refresh(coordinator, semaphore)
+            for coordinator in coordinators.values()
+            if not coordinator.stale
+        )
+    )
+    if coordinators and not restored and not any(results):
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        raise ConfigEntryNotReady("No Hisense device could be reached")
+    first_refresh_done = time.monotonic()
 
-    await hass.config_entries.async_forward_entry_setups(
-        entry, ["climate", "switch", "button", "number", "sensor", "select"]
+    # Home Assistant imports only the platform modules forwarded here, so an
+    # entry without ACs never loads climate or switch, and vice versa for select.
+    platforms = platforms_for_devices(entry.data["devices"])
+    await hass.config_entries.async_forward_entry_setups(entry, platforms)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+    setup_done = time.monotonic()
+    _LOGGER.debug(
+        "Set up %s Hisense device(s) (%s ready, %s restored) in %.2fs: "
+        "storage %.2fs, first refresh %.2fs, platforms %.2fs (%s)",
+        len(coordinators),
+        sum(results),
+        len(restored),
+        setup_done - setup_started,
+        store_loaded - setup_started,
+        first_refresh_done - store_loaded,
+        setup_done - first_refresh_done,
+        ", ".join(platforms),
     )
     return True
 
 
+async def _async_update_listener(hass: core.HomeAssistant, entry: config_entries.ConfigEntry):
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: core.HomeAssistant, entry: config_entries.ConfigEntry):
     unload_ok = await hass.config_entries.async_unload_platforms(
-        entry, ["climate", "switch", "button", "number", "sensor", "select"]
+        entry, platforms_for_devices(entry.data["devices"])
     )
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
     return unload_ok
+
+
+async def async_remove_entry(hass: core.HomeAssistant, entry: config_entries.ConfigEntry):
+    await HisenseStore(hass, entry.entry_id).async_remove()
@@ -23,6 +23,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
 class HisenseACUpdateButton(HisenseEntity, ButtonEntity):
     _attr_translation_key = "force_update"
+    _status_keys = ()
 
     def __init__(self, coordinator):
         super().__init__(coordinator, "force_update_button", "force_update")
@@ -39,6 +40,7 @@ class HisenseACUpdateButton(HisenseEntity, ButtonEntity):
 
 class HisenseACRefreshTokenButton(HisenseEntity, ButtonEntity):
     _attr_translation_key = "refresh_token"
+    _status_keys = ()
 
     def __init__(self, coordinator):
         super().__init__(coordinator, "refresh_token", "refresh_token")
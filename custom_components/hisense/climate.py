@@ -1,9 +1,9 @@
-import asyncio
 import logging
 
 from homeassistant.core import callback
 from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate.const import (
+    ATTR_HVAC_MODE,
     ClimateEntityFeature,
     HVACMode,
     FAN_AUTO,
@@ -25,6 +25,10 @@ from .entity import HisenseEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# How long a powered-off unit gets to report power on before a mode change
+# is given up; the user is waiting on the service call.
+POWER_ON_CONFIRM_TIMEOUT = 6.0
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     coordinators = hass.data[DOMAIN][config_entry.entry_id]
@@ -40,6 +44,14 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
 class HisenseACClimate(HisenseEntity, ClimateEntity):
     _attr_translation_key = "thermostat"
+    _status_keys = (
+        "power_on",
+        "hvac_mode_id",
+        "fan_mode_id",
+        "swing_mode_id",
+        "desired_temperature",
+        "indoor_temperature",
+    )
 
     def __init__(self, coordinator):
         super().__init__(coordinator, "climate", "climate")
@@ -117,10 +129,11 @@ class HisenseACClimate(HisenseEntity, ClimateEntity):
 
     @property
     def hvac_mode(self):
-        if not self.status.get("power_on"):
+        status = self.status
+        if not status.get("power_on"):
             return HVACMode.OFF
         return self._hvac_mode_lookup.get(
-            self.status.get("hvac_mode_id"),
+            status.get("hvac_mode_id"),
             HVACMode.AUTO,
         )
 
@@ -148,6 +161,12 @@ class HisenseACClimate(HisenseEntity, ClimateEntity):
 
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
+        hvac_mode = kwargs.get(ATTR_HVAC_MODE)
+        if hvac_mode is not None:
+            await self._async_set_hvac_mode_and_temperature(
+                hvac_mode, kwargs.get(ATTR_TEMPERATURE)
+            )
+            return
         if not self.status.get("power_on"):
             _LOGGER.error("Cannot set temperature when power is off")
             return
@@ -157,9 +176,20 @@ class HisenseACClimate(HisenseEntity, ClimateEntity):
 
         temperature = kwargs.get(ATTR_TEMPERATURE)
         if temperature is not None:
-            if await self.client.send_logic_command(6, int(temperature)):
+            temperature = int(temperature)
+            self.coordinator.async_note_command()
+            self.coordinator.async_set_optimistic({"desired_temperature": temperature})
+            # Arrow clicks send a burst of setpoints; only the last one is sent.
+            success = await self.coordinator.commands.async_run(
+                "desired_temperature",
+                lambda: self.client.send_logic_command(6, temperature),
+            )
+            if success is None:
+                return
+            if success:
                 self.coordinator.async_update_from_client()
                 return
+            self.coordinator.async_revert_optimistic({"desired_temperature": temperature})
             raise HomeAssistantError("Failed to set Hisense AC temperature")
 
     async def async_set_fan_mode(self, fan_mode):
@@ -191,6 +221,10 @@ class HisenseACClimate(HisenseEntity, ClimateEntity):
 
     async def async_set_hvac_mode(self, hvac_mode):
         """Set new target HVAC mode."""
+        await self._async_set_hvac_mode_and_temperature(hvac_mode, None)
+
+    async def _async_set_hvac_mode_and_temperature(self, hvac_mode, temperature):
+        """Set the HVAC mode and optionally the target temperature in one request."""
         if hvac_mode == HVACMode.OFF:
             await self.async_turn_off()
             return
@@ -198,22 +232,35 @@ class HisenseACClimate(HisenseEntity, ClimateEntity):
         hvac_id = self._hvac_mode_to_id.get(hvac_mode)
         if hvac_id is None:
             raise HomeAssistantError(f"Unsupported Hisense AC HVAC mode: {hvac_mode}")
-        power_on = self.status.get("power_on", False)
-        same_hvac = self.status.get("hvac_mode_id") == hvac_id
+        status = self.status
+        power_on = status.get("power_on", False)
+        same_hvac = status.get("hvac_mode_id") == hvac_id
+
+        # Logic commands share one cmdList and are applied in order.
+        commands = [] if same_hvac and not power_on else [(3, hvac_id)]
+        if temperature is not None and hvac_mode != HVACMode.FAN_ONLY:
+            commands.append((6, int(temperature)))
 
         # power on same hvac   -> set hvac (do nothing)
         # power on different hvac -> set hvac
         # power off same hvac -> turn on
         # power off different hvac -> turn on and set hvac
+        # Power is only exposed as a device model command, so a powered-off
+        # unit still needs its own turn-on request before the logic commands.
         if power_on:
-            success = await self.client.send_logic_command(3, hvac_id)
-        elif same_hvac:
+            success = await self.client.send_logic_commands(commands)
+        elif not commands:
             success = await self.client.turn_on()
         else:
             if not await self.client.turn_on():
                 raise HomeAssistantError("Failed to turn on Hisense AC")
-            await asyncio.sleep(4)
-            success = await self.client.send_logic_command(3, hvac_id)
+            # Wait for the unit to report power on before changing its mode.
+            confirmed = await self.coordinator.async_confirm(
+                {"power_on": True}, timeout=POWER_ON_CONFIRM_TIMEOUT
+            )
+            if confirmed is False:
+                raise HomeAssistantError("Hisense AC did not report power on")
+            success = await self.client.send_logic_commands(commands)
         if success:
             self.coordinator.async_update_from_client()
             return
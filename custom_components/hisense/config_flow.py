@@ -1,8 +1,27 @@
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers import config_validation as cv
-from .const import DOMAIN, CONF_USERNAME, CONF_PASSWORD
+from .const import (
+    DOMAIN,
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    CONF_SETUP_CONCURRENCY,
+    CONF_ADAPTIVE_POLLING,
+    CONF_TEMPERATURE_FILTER,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_AC_TEMPERATURE_HOLD,
+    CONF_FRIDGE_TEMPERATURE_HOLD,
+    DEFAULT_SETUP_CONCURRENCY,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_TEMPERATURE_FILTER,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DEFAULT_AC_TEMPERATURE_HOLD,
+    DEFAULT_FRIDGE_TEMPERATURE_HOLD,
+)
 from .pyhisenseapi import HiSenseLogin
 
 class HisenseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -15,6 +34,11 @@ class HisenseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._refresh_token = None
         self._device_info = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        return HisenseOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input=None):
         errors = {}
 
@@ -126,3 +150,63 @@ class HisenseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=data_schema,
             errors=errors,
         )
+
+
+class HisenseOptionsFlow(config_entries.OptionsFlow):
+    def __init__(self, config_entry):
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_SETUP_CONCURRENCY,
+                        default=options.get(
+                            CONF_SETUP_CONCURRENCY, DEFAULT_SETUP_CONCURRENCY
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=64)),
+                    vol.Optional(
+                        CONF_ADAPTIVE_POLLING,
+                        default=options.get(
+                            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_TEMPERATURE_FILTER,
+                        default=options.get(
+                            CONF_TEMPERATURE_FILTER, DEFAULT_TEMPERATURE_FILTER
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_MIN_PUBLISH_INTERVAL,
+                        default=options.get(
+                            CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Optional(
+                        CONF_TEMPERATURE_DEADBAND,
+                        default=options.get(
+                            CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+                    vol.Optional(
+                        CONF_AC_TEMPERATURE_HOLD,
+                        default=options.get(
+                            CONF_AC_TEMPERATURE_HOLD, DEFAULT_AC_TEMPERATURE_HOLD
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=120)),
+                    vol.Optional(
+                        CONF_FRIDGE_TEMPERATURE_HOLD,
+                        default=options.get(
+                            CONF_FRIDGE_TEMPERATURE_HOLD, DEFAULT_FRIDGE_TEMPERATURE_HOLD
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=120)),
+                }
+            ),
+        )
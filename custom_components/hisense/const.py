@@ -5,6 +5,45 @@ DOMAIN = "hisense"
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 
+# Option keys
+CONF_SETUP_CONCURRENCY = "setup_concurrency"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_TEMPERATURE_FILTER = "temperature_filter"
+CONF_MIN_PUBLISH_INTERVAL = "min_publish_interval"
+CONF_TEMPERATURE_DEADBAND = "temperature_deadband"
+CONF_AC_TEMPERATURE_HOLD = "ac_temperature_hold"
+CONF_FRIDGE_TEMPERATURE_HOLD = "fridge_temperature_hold"
+
+DEFAULT_SETUP_CONCURRENCY = 8
+DEFAULT_ADAPTIVE_POLLING = True
+DEFAULT_TEMPERATURE_FILTER = True
+# Seconds; 0 publishes filtered readings as soon as they pass the deadband.
+DEFAULT_MIN_PUBLISH_INTERVAL = 0
+# °C; a smaller temperature change is published only after the hold time.
+DEFAULT_TEMPERATURE_DEADBAND = 2
+# Minutes. The AC is polled about once a minute while it runs; fridges are
+# polled every few minutes and their readings drift slowly.
+DEFAULT_AC_TEMPERATURE_HOLD = 3
+DEFAULT_FRIDGE_TEMPERATURE_HOLD = 10
+
+# Entity platforms with entities for each device type. Every device has the
+# refresh buttons and the request metric sensors.
+AC_PLATFORMS = ("climate", "switch", "number", "sensor", "button")
+FRIDGE_PLATFORMS = ("number", "sensor", "select", "button")
+
+
+def platforms_for_devices(devices: list[dict]) -> list[str]:
+    """Entity platforms needed for the devices of a config entry."""
+    platforms: list[str] = []
+    for device in devices:
+        device_platforms = (
+            FRIDGE_PLATFORMS if device.get("device_type") == "冰箱" else AC_PLATFORMS
+        )
+        for platform in device_platforms:
+            if platform not in platforms:
+                platforms.append(platform)
+    return platforms
+
 
 def climate_limits_signal(device_id: str) -> str:
     """Dispatcher signal when per-device climate min/max limits change."""
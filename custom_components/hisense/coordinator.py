@@ -2,40 +2,124 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import timedelta
+import time
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
-from .pyhisenseapi import HiSenseAC, HiSenseFridge
+from .const import (
+    DEFAULT_AC_TEMPERATURE_HOLD,
+    DEFAULT_FRIDGE_TEMPERATURE_HOLD,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DOMAIN,
+)
+from .debounce import HisenseCommandCoalescer
+from .filtering import (
+    AC_FILTERED_READINGS,
+    FRIDGE_FILTERED_READINGS,
+    DeadbandFilter,
+    deadband_rules,
+)
+from .polling import AC_POLLING_PROFILE, FRIDGE_POLLING_PROFILE, AdaptivePollingScheduler
+from .pyhisenseapi import DeviceStatus, HiSenseAC, HiSenseAccount, HiSenseFridge
 
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+# Status confirmation after a command: first poll after CONFIRM_FIRST_DELAY,
+# each next wait CONFIRM_BACKOFF times longer up to CONFIRM_MAX_DELAY, and
+# give up after CONFIRM_TIMEOUT seconds.
+CONFIRM_FIRST_DELAY = 0.5
+CONFIRM_BACKOFF = 1.5
+CONFIRM_MAX_DELAY = 4.0
+CONFIRM_TIMEOUT = 20.0
+# A status fetched this recently (seconds) is reused instead of polled again.
+STATUS_MAX_AGE = 0.5
 
-class HisenseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+
+class HisenseDataUpdateCoordinator(DataUpdateCoordinator[DeviceStatus]):
     """Coordinator for a single Hisense device (AC or Fridge)."""
 
     def __init__(
         self,
         hass: HomeAssistant,
         client: HiSenseAC | HiSenseFridge,
-        device_type: str = "空调"
+        device_type: str = "空调",
+        account: HiSenseAccount | None = None,
+        peers: dict[str, HisenseDataUpdateCoordinator] | None = None,
+        adaptive_polling: bool = True,
+        temperature_filter: bool = True,
+        min_publish_interval: float = 0.0,
+        temperature_deadband: float = DEFAULT_TEMPERATURE_DEADBAND,
+        temperature_hold: timedelta | None = None,
     ) -> None:
-        """Initialize the coordinator."""
+        """Initialize the coordinator.
+
+        ``account`` batches status polls for every device on the account and
+        ``peers`` maps device ids to the coordinators that share it. Without
+        ``adaptive_polling`` the device is only refreshed on demand. With
+        ``temperature_filter`` temperature changes smaller than
+        ``temperature_deadband`` are held back until they last
+        ``temperature_hold`` (by default the device type's), and a reading
+        changes at most once per ``min_publish_interval`` seconds.
+        """
         self.client = client
         self.device_type = device_type
+        self.account = account
+        self.peers = peers if peers is not None else {}
+        self.commands = HisenseCommandCoalescer()
+        self._confirmation: asyncio.Task[bool] | None = None
+        self.polling: AdaptivePollingScheduler | None = None
+        # Last status published before a restart, shown until the first fetch.
+        self.restored: DeviceStatus | None = None
+        # Commanded values shown before the device reports them. They are laid
+        # over every fetched status until a confirmation ends or they expire.
+        self._pending: dict[str, Any] = {}
+        self._pending_until = 0.0
+        # What each pending key showed before it was commanded.
+        self._reverts: dict[str, Any] = {}
+        self.filter: DeadbandFilter | None = None
+        if temperature_filter:
+            is_fridge = device_type == "冰箱"
+            if temperature_hold is None:
+                temperature_hold = timedelta(
+                    minutes=DEFAULT_FRIDGE_TEMPERATURE_HOLD
+                    if is_fridge
+                    else DEFAULT_AC_TEMPERATURE_HOLD
+                )
+            self.filter = DeadbandFilter(
+                deadband_rules(
+                    FRIDGE_FILTERED_READINGS if is_fridge else AC_FILTERED_READINGS,
+                    temperature_deadband,
+                    temperature_hold,
+                ),
+                min_publish_interval,
+            )
+        # Data and availability the listeners were last notified about.
+        self._notified_data: DeviceStatus | None = None
+        self._notified_success = True
+        if adaptive_polling:
+            self.polling = AdaptivePollingScheduler(
+                FRIDGE_POLLING_PROFILE if device_type == "冰箱" else AC_POLLING_PROFILE
+            )
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{client.device_id}",
-            update_interval=None,
+            update_interval=self.polling.next_interval() if self.polling else None,
+            # Polls that decode to the same status do not write entity state.
+            always_update=False,
         )
 
     async def _async_setup(self) -> None:
         """Refresh the cloud access token before the first status fetch."""
+        if self.account is not None and self.account.access_token is not None:
+            # Another device on the account already fetched the shared token.
+            return
         try:
             refreshed = await self.client.refresh()
         except Exception as err:
@@ -44,16 +128,215 @@ class HisenseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return
         raise UpdateFailed("Failed to refresh Hisense access token")
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_update_data(self) -> DeviceStatus:
         """Fetch fresh state from the Hisense cloud."""
+        if self.account is not None:
+            return await self._async_update_data_from_account()
         try:
-            status = await self.client.check_status()
+            status = await self.client.check_status(max_age=STATUS_MAX_AGE)
         except Exception as err:
             raise UpdateFailed(f"Failed to fetch Hisense {self.device_type} status") from err
         if not status:
             raise UpdateFailed(f"Failed to fetch Hisense {self.device_type} status")
+        status = self._async_overlay(self._async_filter(status))
+        self._async_adapt_interval(status)
+        return status
+
+    async def _async_update_data_from_account(self) -> DeviceStatus:
+        """Fetch every device on the account in one request and feed the peers."""
+        try:
+            updated = await self.account.check_all(max_age=STATUS_MAX_AGE)
+        except Exception as err:
+            raise UpdateFailed(f"Failed to fetch Hisense {self.device_type} status") from err
+        if self.client.device_id not in updated:
+            raise UpdateFailed(f"Failed to fetch Hisense {self.device_type} status")
+        for device_id in updated:
+            peer = self.peers.get(device_id)
+            if peer is not None and peer is not self:
+                peer.async_set_updated_data(peer.client.get_status())
+        status = self._async_overlay(self._async_filter(self.client.get_status()))
+        self._async_adapt_interval(status)
         return status
 
+    @callback
+    def async_set_updated_data(self, data: DeviceStatus) -> None:
+        """Push a status fetched from the device, filtering its readings first."""
+        self._async_publish(self._async_overlay(self._async_filter(data)))
+
+    @callback
+    def _async_publish(self, data: DeviceStatus) -> None:
+        """Adapt the poll interval to pushed data before rescheduling.
+
+        Unchanged data only restarts the poll timer; listeners are not called.
+        """
+        self._async_adapt_interval(data)
+        if self.always_update or not self.last_update_success or data != self.data:
+            super().async_set_updated_data(data)
+            return
+        self._async_unsub_refresh()
+        self._debounced_refresh.async_cancel()
+        if self._listeners:
+            self._schedule_refresh()
+
+    @callback
+    def _async_show(self, data: DeviceStatus) -> None:
+        """Publish data that was not fetched from the device.
+
+        Availability and the poll timer are left as they are, so an
+        unreachable device stays unavailable.
+        """
+        if data == self.data:
+            return
+        self.data = data
+        self.async_update_listeners()
+
+    @property
+    def status(self) -> DeviceStatus:
+        """Return the published status, or the restored one before the first fetch."""
+        if self.data is not None:
+            return self.data
+        if self.restored is not None:
+            return self.restored
+        return self.client.get_status()
+
+    @property
+    def optimistic(self) -> bool:
+        """Return whether the published data holds commanded values not fetched back yet."""
+        return bool(self._pending)
+
+    @property
+    def stale(self) -> bool:
+        """Return whether the status shown was restored and not fetched yet."""
+        return self.data is None and self.restored is not None
+
+    @callback
+    def async_restore(self, values: dict[str, Any]) -> None:
+        """Show a status saved before a restart until a live one arrives."""
+        self.restored = self.client.STATUS_TYPE(values)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose status keys changed.
+
+        Entities pass the keys they read as their coordinator context; a
+        listener without a context, or any change of availability, is
+        always notified.
+        """
+        data = self.data
+        previous = self._notified_data
+        changed: frozenset[str] | None = None
+        if (
+            data is not None
+            and previous is not None
+            and self.last_update_success == self._notified_success
+        ):
+            changed = data.changed_keys(previous)
+        self._notified_data = data
+        self._notified_success = self.last_update_success
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    @callback
+    def async_note_command(self) -> None:
+        """Poll quickly for a while after a command was sent to the device."""
+        if self.polling is not None:
+            self.polling.note_command()
+
+    @callback
+    def async_set_optimistic(self, changes: dict[str, Any]) -> None:
+        """Show commanded values right away, before the cloud confirms them."""
+        status = self.status
+        for key in changes.keys() - self._pending.keys():
+            self._reverts[key] = status.get(key)
+        self._pending.update(changes)
+        self._pending_until = time.monotonic() + CONFIRM_TIMEOUT
+        # Derived from published data, so it skips the reading filter.
+        self._async_show(status.patch(changes))
+
+    @callback
+    def async_revert_optimistic(self, changes: dict[str, Any]) -> None:
+        """Show again what the keys of a failed command held before it was sent."""
+        reverted = {key: self._reverts[key] for key in changes if key in self._pending}
+        if not reverted:
+            return
+        for key in reverted:
+            del self._pending[key]
+        self._async_show(self.status.patch(reverted))
+
+    async def async_confirm(
+        self, expected: dict[str, Any], timeout: float = CONFIRM_TIMEOUT
+    ) -> bool | None:
+        """Poll the device until its status matches ``expected``.
+
+        Returns True as soon as the status matches and False once ``timeout``
+        passes. A newer confirmation for the device cancels this one, which
+        then returns None.
+        """
+        if self._confirmation is not None and not self._confirmation.done():
+            self._confirmation.cancel()
+        task = self._confirmation = asyncio.ensure_future(
+            self._async_confirm(expected, timeout)
+        )
+        try:
+            await asyncio.wait((task,))
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        if task.cancelled():
+            return None
+        return task.result()
+
+    async def _async_confirm(self, expected: dict[str, Any], timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        delay = CONFIRM_FIRST_DELAY
+        status = None
+        while (remaining := deadline - time.monotonic()) > 0:
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * CONFIRM_BACKOFF, CONFIRM_MAX_DELAY)
+            status = await self.client.check_status()
+            # Unconfirmed polls are not pushed so the optimistic state stays put.
+            if status and all(status.get(key) == value for key, value in expected.items()):
+                self._pending.clear()
+                self.async_set_updated_data(status)
+                return True
+        _LOGGER.debug(
+            "Hisense device %s did not confirm %s within %.0fs",
+            self.client.device_id,
+            expected,
+            timeout,
+        )
+        self._pending.clear()
+        if status:
+            self.async_set_updated_data(status)
+        return False
+
     def async_update_from_client(self) -> None:
-        """Push the client's cached status into Home Assistant listeners."""
+        """Push the client's cached status after a command into Home Assistant listeners."""
+        self.async_note_command()
         self.async_set_updated_data(self.client.get_status())
+
+    @callback
+    def _async_overlay(self, status: DeviceStatus) -> DeviceStatus:
+        """Lay the pending commanded values over a status fetched from the device."""
+        if not self._pending:
+            return status
+        if time.monotonic() >= self._pending_until:
+            self._pending.clear()
+            return status
+        for key in [key for key, value in self._pending.items() if status.get(key) == value]:
+            del self._pending[key]
+        return status.patch(self._pending) if self._pending else status
+
+    @callback
+    def _async_filter(self, status: DeviceStatus) -> DeviceStatus:
+        if self.filter is None:
+            return status
+        return self.filter.apply(status)
+
+    @callback
+    def _async_adapt_interval(self, status: DeviceStatus) -> None:
+        if self.polling is None:
+            return
+        self.polling.observe(status)
+        self.update_interval = self.polling.next_interval()
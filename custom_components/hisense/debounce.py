@@ -0,0 +1,43 @@
+"""Coalesce bursts of commands for the same Hisense device setting."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+
+# Quiet time after the last change before the command is sent.
+COMMAND_COALESCE_DELAY = 0.8
+
+
+class HisenseCommandCoalescer:
+    """Send only the last command of a burst, per device setting.
+
+    ``async_run`` returns ``None`` when a newer command for the same key
+    superseded the call, either while it waited for the quiet window or while
+    it was in flight; the newer call then owns the outcome.
+    """
+
+    def __init__(self, delay: float = COMMAND_COALESCE_DELAY) -> None:
+        """Initialize the coalescer."""
+        self._delay = delay
+        self._generations: dict[Hashable, int] = {}
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+
+    async def async_run(
+        self, key: Hashable, send: Callable[[], Awaitable[bool]]
+    ) -> bool | None:
+        """Send ``send()`` once no newer command for ``key`` arrived in the quiet window."""
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+        await asyncio.sleep(self._delay)
+        if self._generations[key] != generation:
+            return None
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if self._generations[key] != generation:
+                return None
+            result = await send()
+        if self._generations[key] != generation:
+            return None
+        return result
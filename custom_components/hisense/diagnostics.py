@@ -0,0 +1,107 @@
+"""Diagnostics support for the Hisense integration."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import HisenseDataUpdateCoordinator
+
+TO_REDACT = {
+    "access_token",
+    "password",
+    "refresh_token",
+    "token",
+    "username",
+    "wifi_id",
+}
+
+
+def _timestamp(value: float) -> str:
+    return datetime.fromtimestamp(value, timezone.utc).isoformat()
+
+
+def _request_history(history) -> list[dict[str, Any]]:
+    return [
+        {
+            "time": _timestamp(timestamp),
+            "endpoint": endpoint,
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "ok": ok,
+            "result_code": result_code,
+            "error": error.value if error is not None else None,
+        }
+        for timestamp, endpoint, elapsed, ok, result_code, error in history
+    ]
+
+
+def _payload_history(client) -> list[dict[str, Any]]:
+    # Payloads are only decoded here so the polling path just stores the string.
+    payloads = []
+    for timestamp, payload in client.payload_history:
+        try:
+            decoded = client.decode_status(payload)
+        except (IndexError, TypeError, ValueError) as err:
+            decoded = {"error": str(err)}
+        payloads.append(
+            {"time": _timestamp(timestamp), "payload": payload, "decoded": decoded}
+        )
+    return payloads
+
+
+def _coordinator_diagnostics(
+    coordinator: HisenseDataUpdateCoordinator,
+) -> dict[str, Any]:
+    client = coordinator.client
+    return {
+        "device_type": coordinator.device_type,
+        "last_update_success": coordinator.last_update_success,
+        "stale": coordinator.stale,
+        "update_interval": (
+            coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None
+        ),
+        "data": coordinator.data.as_dict() if coordinator.data is not None else None,
+        "metrics": client.metrics.as_dict(),
+        "requests": _request_history(client.metrics.history),
+        "payloads": _payload_history(client),
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinators: dict[str, HisenseDataUpdateCoordinator] = hass.data.get(
+        DOMAIN, {}
+    ).get(entry.entry_id, {})
+    accounts = {}
+    for coordinator in coordinators.values():
+        account = coordinator.account
+        if account is None or id(account) in accounts:
+            continue
+        accounts[id(account)] = {
+            "devices": list(account.clients),
+            "access_token_issued_at": account.access_token_issued_at,
+            "circuit_breaker": account.breaker.as_dict(),
+            "scheduler": account.scheduler.as_dict(),
+            "metrics": account.metrics.as_dict(),
+            "requests": _request_history(account.metrics.history),
+        }
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "accounts": list(accounts.values()),
+        "devices": {
+            device_id: _coordinator_diagnostics(coordinator)
+            for device_id, coordinator in coordinators.items()
+        },
+    }
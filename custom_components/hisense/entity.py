@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -9,13 +10,15 @@ from homeassistant.util import slugify
 
 from .const import DOMAIN
 from .coordinator import HisenseDataUpdateCoordinator
-from .pyhisenseapi import HiSenseAC, HiSenseFridge
+from .pyhisenseapi import DeviceStatus, HiSenseAC, HiSenseFridge
 
 
 class HisenseEntity(CoordinatorEntity[HisenseDataUpdateCoordinator]):
     """Base entity for one Hisense device."""
 
     _attr_has_entity_name = True
+    # Status keys the entity state depends on; None means every key.
+    _status_keys: Iterable[str] | None = None
 
     def __init__(
         self,
@@ -23,9 +26,18 @@ class HisenseEntity(CoordinatorEntity[HisenseDataUpdateCoordinator]):
         unique_suffix: str,
         object_suffix: str,
         icon: str | None = None,
+        status_keys: Iterable[str] | None = None,
     ) -> None:
-        """Initialize the entity."""
-        super().__init__(coordinator)
+        """Initialize the entity.
+
+        The entity only writes state when one of ``status_keys`` (default
+        ``_status_keys``) changes, or when the device availability does.
+        """
+        if status_keys is None:
+            status_keys = self._status_keys
+        super().__init__(
+            coordinator, None if status_keys is None else frozenset(status_keys)
+        )
         
         device_id = coordinator.client.device_id
         slugified_device_id = slugify(device_id)
@@ -42,9 +54,16 @@ class HisenseEntity(CoordinatorEntity[HisenseDataUpdateCoordinator]):
         return self.coordinator.client
 
     @property
-    def status(self) -> dict[str, Any]:
-        """Return the latest coordinated status."""
-        return self.coordinator.data or self.client.get_status()
+    def status(self) -> DeviceStatus:
+        """Return the latest coordinated status snapshot, shared and read-only."""
+        return self.coordinator.status
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag a state restored from before a restart until it is fetched again."""
+        if self.coordinator.stale:
+            return {"stale": True}
+        return None
 
     @property
     def device_info(self):
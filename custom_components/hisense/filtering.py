@@ -0,0 +1,104 @@
+"""Deadband filtering of noisy Hisense temperature readings."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+import time
+
+from .pyhisenseapi import DeviceStatus
+
+
+@dataclass(frozen=True)
+class DeadbandRule:
+    """How one temperature reading is filtered before it reaches the entities."""
+
+    # A change of at least this much from the published value is published
+    # right away.
+    deadband: float
+    # A smaller change is published once the reading has held the new value
+    # this long, so a ±1 °C flip between polls is dropped but a real drift
+    # still gets through.
+    hold: timedelta
+
+
+# Temperature readings the filter applies to, by device type.
+AC_FILTERED_READINGS = ("indoor_temperature",)
+FRIDGE_FILTERED_READINGS = (
+    "refrigerator_real_temperature",
+    "freeze_real_temperature",
+    "variation_real_temperature",
+    "ambient_temperature",
+)
+
+
+def deadband_rules(readings, deadband: float, hold: timedelta) -> dict[str, DeadbandRule]:
+    """Filter every reading in ``readings`` with the same deadband and hold."""
+    rule = DeadbandRule(deadband=deadband, hold=hold)
+    return dict.fromkeys(readings, rule)
+
+
+class _Reading:
+    """Published value and pending change of one reading."""
+
+    __slots__ = ("published", "published_at", "candidate", "candidate_since")
+
+    def __init__(self, value, now: float) -> None:
+        self.published = value
+        self.published_at = now
+        self.candidate = None
+        self.candidate_since = now
+
+
+class DeadbandFilter:
+    """Hold back reading changes that fall inside a deadband.
+
+    ``min_interval`` additionally keeps a reading at its published value for
+    that many seconds after it last changed; 0 disables it. Only fresh device
+    statuses should be passed to ``apply``: a reading equal to the published
+    value cancels any pending change.
+    """
+
+    def __init__(
+        self, rules: dict[str, DeadbandRule], min_interval: float = 0.0
+    ) -> None:
+        """Initialize the filter."""
+        self.rules = rules
+        self.min_interval = min_interval
+        self._readings: dict[str, _Reading] = {}
+
+    def apply(self, status: DeviceStatus) -> DeviceStatus:
+        """Return ``status`` with filtered readings replaced by their published value."""
+        now = time.monotonic()
+        held = {}
+        for key, rule in self.rules.items():
+            value = status.get(key)
+            if value is None:
+                continue
+            reading = self._readings.get(key)
+            if reading is None:
+                self._readings[key] = _Reading(value, now)
+                continue
+            published = self._publish(reading, rule, value, now)
+            if published != value:
+                held[key] = published
+        return status.patch(held) if held else status
+
+    def _publish(self, reading: _Reading, rule: DeadbandRule, value, now: float):
+        if value == reading.published:
+            reading.candidate = None
+            return value
+        if value != reading.candidate:
+            reading.candidate = value
+            reading.candidate_since = now
+        if (
+            abs(value - reading.published) < rule.deadband
+            and now - reading.candidate_since < rule.hold.total_seconds()
+        ):
+            return reading.published
+        if now - reading.published_at < self.min_interval:
+            return reading.published
+        reading.published = value
+        reading.published_at = now
+        reading.candidate = None
+        return value
@@ -1,5 +1,3 @@
-import asyncio
-
 from homeassistant.components.number import NumberEntity, NumberEntityDescription, NumberMode
 from homeassistant.const import UnitOfTemperature
 from homeassistant.core import callback
@@ -87,6 +85,9 @@ class HisenseClimateLimitNumber(HisenseEntity, NumberEntity):
 
     entity_description: NumberEntityDescription
 
+    # The limits live on the client and are pushed through the dispatcher.
+    _status_keys = ()
+
     def __init__(self, coordinator, description: NumberEntityDescription, is_min: bool):
         super().__init__(coordinator, description.key, description.key)
         self.entity_description = description
@@ -130,7 +131,18 @@ class HisenseFridgeTemperatureNumber(HisenseEntity, NumberEntity):
     entity_description: NumberEntityDescription
 
     def __init__(self, coordinator, description: NumberEntityDescription):
-        super().__init__(coordinator, description.key, description.key, description.icon)
+        set_key = (
+            "refrigerator_set_temperature"
+            if description.key == "refrigerator_temp_control"
+            else "freeze_set_temperature"
+        )
+        super().__init__(
+            coordinator,
+            description.key,
+            description.key,
+            description.icon,
+            status_keys=("work_mode", set_key),
+        )
         self.entity_description = description
 
     @property
@@ -154,35 +166,42 @@ class HisenseFridgeTemperatureNumber(HisenseEntity, NumberEntity):
         v = round(value)
         
         if self.entity_description.key == "refrigerator_temp_control":
-            success = await self.client.set_refrigerator_temperature(v)
+            send = self.client.set_refrigerator_temperature
             label = "refrigerator"
             data_key = "refrigerator_set_temperature"
         else:
-            success = await self.client.set_freeze_temperature(v)
+            send = self.client.set_freeze_temperature
             label = "freezer"
             data_key = "freeze_set_temperature"
-        if not success:
-            raise HomeAssistantError(f"Failed to set Hisense {label} temperature")
 
-        self.coordinator.data[data_key] = v
+        changes = {data_key: v}
         
         work_mode = self.status.get("work_mode", "自定义")
         if work_mode == "智能" or work_mode == "速冷":
-            self.coordinator.data["work_mode"] = "自定义"
-            self.coordinator.data["work_mode_id"] = 0
+            changes["work_mode"] = "自定义"
+            changes["work_mode_id"] = 0
             
             if self.entity_description.key == "refrigerator_temp_control":
                 if work_mode == "智能":
-                    self.coordinator.data["freeze_set_temperature"] = -18
+                    changes["freeze_set_temperature"] = -18
                 else:
-                    self.coordinator.data["freeze_set_temperature"] = -16
+                    changes["freeze_set_temperature"] = -16
             else:
                 if work_mode == "智能":
-                    self.coordinator.data["refrigerator_set_temperature"] = 5
+                    changes["refrigerator_set_temperature"] = 5
                 else:
-                    self.coordinator.data["refrigerator_set_temperature"] = 2
+                    changes["refrigerator_set_temperature"] = 2
         
-        self.coordinator.async_set_updated_data(self.coordinator.data)
-        
-        await asyncio.sleep(5)
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_note_command()
+        self.coordinator.async_set_optimistic(changes)
+
+        # Slider drags send a burst of values; only the last one reaches the cloud.
+        success = await self.coordinator.commands.async_run(data_key, lambda: send(v))
+        if success is None:
+            return
+        if not success:
+            self.coordinator.async_revert_optimistic(changes)
+            raise HomeAssistantError(f"Failed to set Hisense {label} temperature")
+
+        # The new value is already shown; confirm it without holding the call open.
+        self.hass.async_create_task(self.coordinator.async_confirm({data_key: v}))
@@ -0,0 +1,86 @@
+"""Activity-aware polling intervals for Hisense devices."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+import time
+from collections.abc import Mapping
+from typing import Any
+
+
+@dataclass(frozen=True)
+class PollingProfile:
+    """Polling intervals for one kind of device."""
+
+    # Interval right after a command, for ``command_window`` seconds.
+    command: timedelta
+    command_window: float
+    # Base interval while the device is running / idle or powered off.
+    active: timedelta
+    idle: timedelta
+    # Bounds for the learned interval.
+    minimum: timedelta
+    maximum: timedelta
+
+
+AC_POLLING_PROFILE = PollingProfile(
+    command=timedelta(seconds=10),
+    command_window=60,
+    active=timedelta(seconds=60),
+    idle=timedelta(minutes=10),
+    minimum=timedelta(seconds=30),
+    maximum=timedelta(minutes=15),
+)
+
+# Fridges are always powered and their readings drift slowly.
+FRIDGE_POLLING_PROFILE = PollingProfile(
+    command=timedelta(seconds=15),
+    command_window=60,
+    active=timedelta(minutes=5),
+    idle=timedelta(minutes=5),
+    minimum=timedelta(minutes=2),
+    maximum=timedelta(minutes=30),
+)
+
+# Weight of the newest poll in the change-rate moving average.
+_CHANGE_RATE_ALPHA = 0.3
+
+
+class AdaptivePollingScheduler:
+    """Pick the next poll interval from device activity and observed change rate."""
+
+    def __init__(self, profile: PollingProfile) -> None:
+        """Initialize the scheduler."""
+        self.profile = profile
+        self.change_rate = 0.25
+        self._last_status: Mapping[str, Any] | None = None
+        self._command_until = 0.0
+
+    def note_command(self) -> None:
+        """Poll quickly for a while after a user command."""
+        self._command_until = time.monotonic() + self.profile.command_window
+
+    def observe(self, status: Mapping[str, Any]) -> None:
+        """Learn how often the device's status actually changes between updates.
+
+        ``status`` is kept by reference, so it must not be mutated afterwards.
+        """
+        if self._last_status is not None:
+            changed = 1.0 if status != self._last_status else 0.0
+            self.change_rate += _CHANGE_RATE_ALPHA * (changed - self.change_rate)
+        self._last_status = status
+
+    def next_interval(self) -> timedelta:
+        """Return the interval until the next poll."""
+        profile = self.profile
+        if time.monotonic() < self._command_until:
+            return profile.command
+
+        running = bool(self._last_status and self._last_status.get("power_on"))
+        base = profile.active if running else profile.idle
+        # A device that changes on a quarter of the polls keeps the base
+        # interval; busier devices are polled up to twice as often and quiet
+        # ones up to half as often.
+        factor = min(2.0, max(0.5, 2 ** (1 - 4 * self.change_rate)))
+        return min(profile.maximum, max(profile.minimum, base * factor))
@@ -1,13 +1,724 @@
-from collections import Counter
-from copy import deepcopy
+from collections import Counter, deque
+from collections.abc import Mapping
+from enum import Enum
+from functools import partial
+from typing import Any, NamedTuple
+import asyncio
+import heapq
+import itertools
+import json
+import random
 import time
 import logging
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _decode_json(body):
+    """Decode a response body; an empty body decodes to None like aiohttp's json()."""
+    return _json_loads(body) if body else None
+
+
 _STATUS_SWING_MODES = {0, 1, 2, 3}
 _MIN_STATUS_VALUES = 210
 _MIN_FRIDGE_STATUS_VALUES = 130
 
+_AC_HVAC_MODES = {
+    0: "FAN_ONLY",
+    1: "HEAT",
+    2: "COOL",
+    3: "DRY",
+    4: "AUTO",
+}
+_AC_FAN_MODES = {
+    0: "AUTO",
+    1: "DIFFUSE",
+    2: "LOW",
+    3: "MEDIUM",
+    4: "HIGH",
+}
+_FRIDGE_WORK_MODES = {
+    0: "自定义",
+    64: "智能",
+    65: "速冷",
+}
+_FRIDGE_VARIATION_MODES = {
+    16: "原鲜",
+    32: "0℃养鲜",
+    64: "母婴",
+}
+
+
+def _decode_status_fields(payload, indices, min_fields, missing=0):
+    """Return the ints at ``indices`` (ascending) of a comma-separated status payload.
+
+    Only the fields that are read get split and converted: low indices come
+    from a bounded ``split`` of the head of the payload and high indices from a
+    bounded ``rsplit`` of its tail. Indices past the end of a payload that has
+    at least ``min_fields`` values decode to ``missing``.
+    """
+    field_count = payload.count(",") + 1
+    if field_count < min_fields:
+        raise ValueError(
+            f"status payload has {field_count} values, expected at least {min_fields}"
+        )
+
+    middle = field_count // 2
+    head_end = 0
+    tail_start = field_count
+    for index in indices:
+        if index <= middle:
+            head_end = index + 1
+        elif index < tail_start:
+            tail_start = index
+    if head_end:
+        head = payload.split(",", head_end)
+    if tail_start < field_count:
+        tail = payload.rsplit(",", field_count - tail_start)
+        tail_offset = len(tail) - field_count
+    values = []
+    for index in indices:
+        if index <= middle:
+            values.append(int(head[index]))
+        elif index < field_count:
+            values.append(int(tail[tail_offset + index]))
+        else:
+            values.append(missing)
+    return values
+
+
+class StatusField(NamedTuple):
+    """One value of a device status payload."""
+
+    index: int
+    key: str
+    # ``bool`` fields are true when the raw value is 1.
+    kind: type = int
+    # Raw value -> label, stored under ``label_key``; unknown values get ``default_label``.
+    labels: dict[int, str] | None = None
+    label_key: str | None = None
+    default_label: str | None = None
+    # Allowed raw values; anything else rejects the whole payload.
+    valid: Any = None
+
+
+class StatusDecoder:
+    """Decoder compiled once from a status schema."""
+
+    def __init__(self, schema, min_fields):
+        fields = sorted(schema, key=lambda field: field.index)
+        self.indices = tuple(field.index for field in fields)
+        if len(set(self.indices)) != len(self.indices):
+            raise ValueError("status schema has duplicate indices")
+        self.min_fields = min_fields
+        self._steps = tuple(
+            (
+                field.key,
+                field.kind is bool,
+                field.valid,
+                field.labels,
+                field.label_key,
+                field.default_label,
+            )
+            for field in fields
+        )
+
+    def decode(self, payload):
+        """Return the status dict for a comma-separated status payload."""
+        values = _decode_status_fields(payload, self.indices, self.min_fields)
+        status = {}
+        for value, (key, is_bool, valid, labels, label_key, default_label) in zip(
+            values, self._steps
+        ):
+            if valid is not None and value not in valid:
+                raise ValueError(f"unknown {key} {value}")
+            status[key] = value == 1 if is_bool else value
+            if labels is not None:
+                status[label_key] = labels.get(value, default_label)
+        return status
+
+
+AC_STATUS_SCHEMA = (
+    StatusField(
+        0, "fan_mode_id", labels=_AC_FAN_MODES, label_key="fan_mode", valid=_AC_FAN_MODES
+    ),
+    StatusField(
+        4, "hvac_mode_id", labels=_AC_HVAC_MODES, label_key="hvac_mode", valid=_AC_HVAC_MODES
+    ),
+    StatusField(5, "power_on", bool),
+    StatusField(9, "desired_temperature"),
+    StatusField(10, "indoor_temperature"),
+    StatusField(44, "nature_wind", bool),
+    StatusField(45, "aux_heat", bool),
+    StatusField(58, "screen_on", bool),
+    StatusField(209, "swing_mode_id", valid=_STATUS_SWING_MODES),
+)
+
+FRIDGE_STATUS_SCHEMA = (
+    StatusField(0, "refrigerator_set_temperature"),
+    StatusField(1, "freeze_set_temperature"),
+    StatusField(
+        3,
+        "work_mode_id",
+        labels=_FRIDGE_WORK_MODES,
+        label_key="work_mode",
+        default_label="自定义",
+    ),
+    StatusField(4, "power_on", bool),
+    StatusField(6, "refrigerator_real_temperature"),
+    StatusField(7, "freeze_real_temperature"),
+    StatusField(8, "variation_real_temperature"),
+    StatusField(9, "ambient_temperature"),
+    # Missing on fridges without a variation zone, which decodes to 0.
+    StatusField(
+        130,
+        "variation_mode_id",
+        labels=_FRIDGE_VARIATION_MODES,
+        label_key="variation_mode",
+        default_label="NORMAL",
+    ),
+)
+
+_AC_STATUS_DECODER = StatusDecoder(AC_STATUS_SCHEMA, _MIN_STATUS_VALUES)
+_FRIDGE_STATUS_DECODER = StatusDecoder(FRIDGE_STATUS_SCHEMA, _MIN_FRIDGE_STATUS_VALUES)
+
+
+def _schema_keys(schema):
+    """Return every status key a schema decodes to, labels included."""
+    keys = []
+    for field in schema:
+        keys.append(field.key)
+        if field.label_key is not None:
+            keys.append(field.label_key)
+    return tuple(keys)
+
+
+class DeviceStatus(Mapping):
+    """Immutable status snapshot of one device.
+
+    One snapshot is built per decoded payload and shared by every reader
+    without copying. It reads like a read-only dict; a key that was never
+    decoded is missing rather than None. ``patch`` returns a changed copy.
+    """
+
+    __slots__ = ()
+    # Values of a snapshot built before the first payload was decoded.
+    _defaults: dict[str, Any] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._keys = frozenset(cls.__slots__)
+        # Slot setters bypass __setattr__, which refuses every assignment.
+        cls._setters = tuple(
+            (key, getattr(cls, key).__set__) for key in cls.__slots__
+        )
+
+    def __init__(self, values=None):
+        if values is None:
+            values = self._defaults
+        for key, setter in self._setters:
+            setter(self, values.get(key))
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} is immutable, use patch()")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"{type(self).__name__} is immutable, use patch()")
+
+    # Immutable, so copy.copy and copy.deepcopy share the snapshot.
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def patch(self, changes):
+        """Return a copy of this snapshot with ``changes`` applied."""
+        unknown = changes.keys() - self._keys
+        if unknown:
+            raise KeyError(f"unknown status keys: {', '.join(sorted(unknown))}")
+        patched = object.__new__(type(self))
+        for key, setter in self._setters:
+            setter(patched, changes[key] if key in changes else getattr(self, key))
+        return patched
+
+    def get(self, key, default=None):
+        if key not in self._keys:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __iter__(self):
+        return (key for key in self.__slots__ if getattr(self, key) is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def _values(self):
+        return tuple(getattr(self, key) for key in self.__slots__)
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            return self._values() == other._values()
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self):
+        return hash(self._values())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def as_dict(self):
+        """Return the decoded keys as a plain dict."""
+        return dict(self)
+
+    def changed_keys(self, other):
+        """Return the keys whose value differs from snapshot ``other``."""
+        if type(other) is not type(self):
+            return self._keys
+        return frozenset(
+            key for key in self.__slots__ if getattr(self, key) != getattr(other, key)
+        )
+
+
+class ACStatus(DeviceStatus):
+    """Status snapshot of an air conditioner."""
+
+    __slots__ = _schema_keys(AC_STATUS_SCHEMA)
+    _defaults = {"power_on": False}
+
+
+class FridgeStatus(DeviceStatus):
+    """Status snapshot of a fridge."""
+
+    __slots__ = _schema_keys(FRIDGE_STATUS_SCHEMA)
+    _defaults = {
+        "power_on": False,
+        "refrigerator_set_temperature": 5,
+        "freeze_set_temperature": -18,
+        "refrigerator_real_temperature": 5,
+        "freeze_real_temperature": -18,
+        "variation_real_temperature": 0,
+        "ambient_temperature": 25,
+        "work_mode_id": 0,
+        "work_mode": "自定义",
+        "variation_mode_id": 0,
+        "variation_mode": "NORMAL",
+    }
+
+
+# Upper bounds, in seconds, of the request latency histogram buckets.
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+# Entries kept in the request and payload ring buffers used for diagnostics.
+HISTORY_SIZE = 20
+REQUEST_ENDPOINTS = (
+    "check",
+    "logic_command",
+    "power_command",
+    "refresh",
+)
+
+
+class EndpointMetrics:
+    """Request counters and a latency histogram for one cloud endpoint."""
+
+    __slots__ = (
+        "requests",
+        "failures",
+        "retries",
+        "result_codes",
+        "errors",
+        "latency_buckets",
+        "latency_total",
+        "last_latency",
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.failures = 0
+        self.retries = 0
+        self.result_codes = Counter()
+        self.errors = Counter()
+        self.latency_buckets = [0] * len(LATENCY_BUCKETS)
+        self.latency_total = 0.0
+        self.last_latency = None
+
+    @property
+    def successes(self):
+        return self.requests - self.failures
+
+    @property
+    def average_latency(self):
+        return self.latency_total / self.requests if self.requests else None
+
+    def record(self, elapsed, ok, result_code=None, error=None):
+        self.requests += 1
+        if not ok:
+            self.failures += 1
+        if error is not None:
+            self.errors[error.value] += 1
+        if result_code is not None:
+            self.result_codes[result_code] += 1
+        self.latency_total += elapsed
+        self.last_latency = elapsed
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if elapsed <= bound:
+                self.latency_buckets[index] += 1
+                break
+
+    def as_dict(self):
+        return {
+            "requests": self.requests,
+            "successes": self.successes,
+            "failures": self.failures,
+            "retries": self.retries,
+            "result_codes": {str(code): count for code, count in self.result_codes.items()},
+            "errors": dict(self.errors),
+            "latency_buckets": {
+                str(bound): count
+                for bound, count in zip(LATENCY_BUCKETS, self.latency_buckets)
+            },
+            "average_latency": self.average_latency,
+            "last_latency": self.last_latency,
+        }
+
+
+class RequestMetrics:
+    """Per-endpoint request metrics of a client or account.
+
+    Requests recorded on a client are also counted on its ``parent``, the
+    metrics of the account it belongs to. ``history`` keeps the last
+    ``HISTORY_SIZE`` requests as ``(time, endpoint, elapsed, ok, result_code,
+    error)``.
+    """
+
+    def __init__(self, parent=None):
+        self.parent = parent
+        self.endpoints = {name: EndpointMetrics() for name in REQUEST_ENDPOINTS}
+        self.token_refreshes = 0
+        self.history = deque(maxlen=HISTORY_SIZE)
+        self._recent = deque()
+
+    def record(self, endpoint, elapsed, ok, result_code=None, error=None, propagate=True):
+        self.endpoints[endpoint].record(elapsed, ok, result_code, error)
+        self.history.append((time.time(), endpoint, elapsed, ok, result_code, error))
+        now = time.monotonic()
+        self._recent.append(now)
+        self._prune(now)
+        if propagate and self.parent is not None:
+            self.parent.record(endpoint, elapsed, ok, result_code, error)
+
+    def record_retry(self, endpoint):
+        self.endpoints[endpoint].retries += 1
+        if self.parent is not None:
+            self.parent.record_retry(endpoint)
+
+    def record_token_refresh(self):
+        self.token_refreshes += 1
+
+    @property
+    def requests(self):
+        return sum(metrics.requests for metrics in self.endpoints.values())
+
+    @property
+    def average_latency(self):
+        requests = self.requests
+        if not requests:
+            return None
+        return sum(metrics.latency_total for metrics in self.endpoints.values()) / requests
+
+    def requests_per_minute(self):
+        self._prune(time.monotonic())
+        return len(self._recent)
+
+    def _prune(self, now):
+        recent = self._recent
+        while recent and now - recent[0] > 60:
+            recent.popleft()
+
+    def as_dict(self):
+        return {
+            "requests_per_minute": self.requests_per_minute(),
+            "token_refreshes": self.token_refreshes,
+            "endpoints": {
+                name: metrics.as_dict() for name, metrics in self.endpoints.items()
+            },
+        }
+
+
+class RequestError(Enum):
+    """Why a cloud request failed.
+
+    AUTH and THROTTLED come from the HTTP status only: the meaning of the
+    cloud's non-zero resultCodes is not documented, so any of them is FAILED.
+    """
+
+    AUTH = "auth"
+    THROTTLED = "throttled"
+    TRANSPORT = "transport"
+    MALFORMED = "malformed"
+    FAILED = "failed"
+
+    @property
+    def refreshes_token(self):
+        """Whether the cloud rejected the access token outright."""
+        return self is RequestError.AUTH
+
+    @property
+    def is_outage(self):
+        """Whether the failure says the cloud itself is unreachable or overloaded."""
+        return self in (RequestError.TRANSPORT, RequestError.THROTTLED)
+
+
+def _classify_http_status(status):
+    """Return the RequestError of an HTTP status, None when the body should be read."""
+    if status in (401, 403):
+        return RequestError.AUTH
+    if status == 429:
+        return RequestError.THROTTLED
+    if status >= 500:
+        return RequestError.TRANSPORT
+    return None
+
+
+def _classify_response(result, key="response"):
+    """Return the RequestError of a decoded response body, None on success."""
+    if not isinstance(result, dict):
+        return RequestError.MALFORMED
+    response = result.get(key)
+    if not isinstance(response, dict):
+        return RequestError.MALFORMED
+    if response.get("resultCode") == 0:
+        return None
+    return RequestError.FAILED
+
+
+class CircuitBreaker:
+    """Stop sending requests to the cloud for a while after repeated failures.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    requests fail fast. The open period doubles with every reopening, up to
+    ``max_delay``, and is spread by ``jitter`` so devices do not retry in
+    lockstep. Once it has passed one probe request is let through
+    (half-open); its outcome closes the breaker or opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold=3,
+        base_delay=10.0,
+        max_delay=600.0,
+        jitter=0.2,
+        probe_timeout=60.0,
+    ):
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.probe_timeout = probe_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.openings = 0
+        self.opened_until = 0.0
+        self._probe_started = None
+
+    @property
+    def retry_after(self):
+        """Seconds until the next probe is allowed, 0 when requests may be sent."""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.opened_until - time.monotonic())
+
+    def allow_request(self):
+        now = time.monotonic()
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if now < self.opened_until:
+                return False
+            self.state = self.HALF_OPEN
+            self._probe_started = now
+            return True
+        # Half-open: one probe at a time, unless it never reported back.
+        if now - self._probe_started >= self.probe_timeout:
+            self._probe_started = now
+            return True
+        return False
+
+    def record(self, error):
+        """Record a request outcome; only outages count as failures."""
+        if error is not None and error.is_outage:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_success(self):
+        if self.state != self.CLOSED:
+            _LOGGER.info("Hisense cloud recovered, closing circuit breaker")
+        self.state = self.CLOSED
+        self.failures = 0
+        self.openings = 0
+        self._probe_started = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self._open()
+
+    def _open(self):
+        delay = min(self.max_delay, self.base_delay * 2 ** self.openings)
+        delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        self.openings += 1
+        self.state = self.OPEN
+        self.opened_until = time.monotonic() + delay
+        self._probe_started = None
+        _LOGGER.warning(
+            "Hisense cloud failed %s time(s) in a row, pausing requests for %.0fs",
+            self.failures,
+            delay,
+        )
+
+    def as_dict(self):
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "openings": self.openings,
+            "retry_after": round(self.retry_after, 1),
+        }
+
+
+def _retrieve_exception(future):
+    """Mark a failed future's exception as retrieved so asyncio does not log it."""
+    if not future.cancelled():
+        future.exception()
+
+
+class RequestScheduler:
+    """Order and pace the cloud requests of one account.
+
+    At most ``max_concurrency`` requests run at once, and a token bucket
+    refilled at ``rate`` per second (holding up to ``burst``) limits the
+    request rate. Queued requests start in priority order: token refreshes,
+    then user commands, then background polls. A request queued with the
+    ``key`` of one still waiting shares its result instead of being sent
+    again.
+    """
+
+    REFRESH = 0
+    COMMAND = 1
+    POLL = 2
+
+    def __init__(self, max_concurrency=4, rate=5.0, burst=10):
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.burst = burst
+        self.merged = 0
+        self._queue = []
+        self._queued = {}
+        self._active = 0
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._order = itertools.count()
+        self._timer = None
+
+    async def run(self, priority, request, key=None):
+        """Run ``request()`` once the scheduler lets it through and return its result."""
+        future = self._queued.get(key) if key is not None else None
+        if future is not None:
+            self.merged += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            # Every caller may have given up by the time the request fails.
+            future.add_done_callback(_retrieve_exception)
+            heapq.heappush(self._queue, (priority, next(self._order), key, request, future))
+            if key is not None:
+                self._queued[key] = future
+            self._pump()
+        # Merged callers share the request, so one caller giving up must not cancel it.
+        return await asyncio.shield(future)
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def _pump(self):
+        while self._queue and self._active < self.max_concurrency:
+            self._refill()
+            if self._tokens < 1:
+                if self._timer is None:
+                    self._timer = asyncio.get_running_loop().call_later(
+                        (1 - self._tokens) / self.rate, self._on_timer
+                    )
+                return
+            self._tokens -= 1
+            _, _, key, request, future = heapq.heappop(self._queue)
+            if key is not None:
+                self._queued.pop(key, None)
+            self._active += 1
+            task = asyncio.ensure_future(request())
+            task.add_done_callback(partial(self._finish, future))
+
+    def _on_timer(self):
+        self._timer = None
+        self._pump()
+
+    def _finish(self, future, task):
+        self._active -= 1
+        if not future.done():
+            if task.cancelled():
+                future.cancel()
+            elif task.exception() is not None:
+                future.set_exception(task.exception())
+            else:
+                future.set_result(task.result())
+        self._pump()
+
+    def as_dict(self):
+        self._refill()
+        return {
+            "queued": len(self._queue),
+            "active": self._active,
+            "tokens": round(self._tokens, 2),
+            "merged": self.merged,
+        }
+
+
+def _result_code(result):
+    """Return ``result["response"]["resultCode"]`` of a decoded response, if present."""
+    if isinstance(result, dict):
+        response = result.get("response")
+        if isinstance(response, dict):
+            return response.get("resultCode")
+    return None
+
 
 def _device_type_from_name(device_type_name) -> str | None:
     if not isinstance(device_type_name, str):
@@ -233,387 +944,310 @@ class HiSenseLogin:
             return devices
 
 
-class HiSenseAC:
-    def __init__(self, wifi_id, device_id, refresh_token, session, device_name="", entity_name=""):
-        self.wifi_id = wifi_id
-        self.device_id = device_id
-        self.refresh_token = refresh_token
-        self.access_token = None
-        self.session = session
-        self.device_name = device_name
-        self.entity_name = entity_name
-        app_name_encoding = "%E6%B5%B7%E4%BF%A1%E6%99%BA%E6%85%A7%E5%AE%B6"
-        # app_name = "海信智慧家"
-        # app_name_encoding = urllib.parse.quote(app_name)
-        self.headers = {
-            'Host': 'api-wg.hismarttv.com',
-            'Content-Type': 'application/json',
-            'Connection': 'keep-alive',
-            'Accept': '*/*',
-            'User-Agent': f"{app_name_encoding}/4 CFNetwork/1492.0.1 Darwin/23.3.0",
-            'Accept-Language': 'zh-CN,zh-Hans;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-        }
-        self.refresh_headers = {
-            'Host': 'bas-wg.hismarttv.com',
-            'Content-Type': 'application/x-www-form-urlencoded',
-            'Connection': 'keep-alive',
-            'Accept': '*/*',
-            'User-Agent': f"{app_name_encoding}/4 CFNetwork/1492.0.1 Darwin/23.3.0",
-            'Accept-Language': 'zh-CN,zh-Hans;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br'
-        }
-        self.url_head = "https://api-wg.hismarttv.com/agw/dsg/outer"
-        self.power_url = f"{self.url_head}/sendDeviceModelCmd?accessToken="
-        self.command_url = f"{self.url_head}/uploadRemoteLogicCmd?accessToken="
-        self.check_url = f"{self.url_head}/getDeviceLogicalStatusArray?accessToken="
-        self.refresh_url = "https://bas-wg.hismarttv.com/aaa/refresh_token2"
-        self.power_data_template = {
-            "wifiId": wifi_id,
-            "deviceId": device_id,
-            "extendParam": "1",
-            "cmdVersion": "0",
-        }
-        self.check_data_template = {
-            "deviceList": [
-                {
-                    "wifiId": wifi_id,
-                    "deviceId": device_id,
-                }
-            ]
-        }
-        self.command_data_template = {
-            "wifiId": wifi_id,
-            "deviceId": device_id,
-            "extendParm": "1",
-            "cmdVersion": "1684085201",
-        }
-        self.status = {
-            "power_on": False,
-        }
-        self.hvac_mode_lookup = {
-            0: "FAN_ONLY",
-            1: "HEAT",
-            2: "COOL",
-            3: "DRY",
-            4: "AUTO",
-        }
-        self.fan_mode_lookup = {
-            0: "AUTO",
-            1: "DIFFUSE",
-            2: "LOW",
-            3: "MEDIUM",
-            4: "HIGH",
-        }
-        self.climate_min_temp = 16
-        self.climate_max_temp = 32
-
-    async def _send_command(self, url, command_data, status_required=True):
-        post_url = f"{url}{self.access_token}"
-        try:
-            async with self.session.post(
-                post_url,
-                headers=self.headers,
-                json=command_data,
-            ) as response:
-                result = await response.json()
-        except Exception:
-            _LOGGER.error("Hisense request failed", exc_info=True)
-            return False
-
-        if not isinstance(result, dict):
-            _LOGGER.error("Hisense response is not an object: %s", result)
-            return False
+# urllib.parse.quote("海信智慧家")
+_APP_NAME_ENCODING = "%E6%B5%B7%E4%BF%A1%E6%99%BA%E6%85%A7%E5%AE%B6"
+_USER_AGENT = f"{_APP_NAME_ENCODING}/4 CFNetwork/1492.0.1 Darwin/23.3.0"
 
-        response_obj = result.get("response")
-        if not isinstance(response_obj, dict):
-            _LOGGER.error("Hisense response missing response object: %s", result)
-            return False
 
-        result_code = response_obj.get("resultCode")
-        if result_code != 0:
-            _LOGGER.warning("Hisense request failed with resultCode=%s", result_code)
-            return False
+# A FAILED response refreshes the access token at most this often (seconds).
+FAILED_REFRESH_INTERVAL = 10 * 60
 
-        if not status_required:
-            try:
-                self._extract_status_payload(result)
-            except ValueError:
-                _LOGGER.debug("Hisense response accepted without status payload")
-                return None
-
-        if self._update_status_from_result(result):
-            return True
-
-        if not status_required:
-            return None
-
-        _LOGGER.error("Hisense response did not include a usable status payload")
-        return False
 
-    async def _robust_send_command(self, url, command_data, status_required=True):
-        result = await self._send_command(url, command_data, status_required)
-        if result is not False:
-            return result
-        _LOGGER.info("Attempting to refresh token and retry command")
-        if not await self.refresh():
-            _LOGGER.error("Failed to refresh token")
-            return False
-        return await self._send_command(url, command_data, status_required)
+class _CloudRequester:
+    """Cloud request and token refresh plumbing of device clients and accounts.
 
-    def _extract_status_payload(self, result):
-        if not isinstance(result, dict):
-            raise ValueError("response is not an object")
-        response = result.get("response")
-        if not isinstance(response, dict):
-            raise ValueError("missing response object")
-
-        pre_status = response.get("preStatus")
-        if isinstance(pre_status, str) and pre_status:
-            return pre_status
-
-        status_list = response.get("deviceStatusList")
-        if isinstance(status_list, list) and status_list:
-            first_status = status_list[0]
-            if isinstance(first_status, dict):
-                device_status = first_status.get("deviceStatus")
-                if isinstance(device_status, str) and device_status:
-                    return device_status
-
-        raise ValueError("missing status payload")
+    Subclasses provide ``session``, ``metrics``, ``refresh_token``,
+    ``refresh_url`` and the ``HEADERS`` and ``REFRESH_HEADERS`` to send, and
+    the ``access_token_verified`` and ``_failed_refresh_at`` token state.
+    """
 
-    def _update_status_from_result(self, result):
-        try:
-            result_list_str = self._extract_status_payload(result)
-            result_list = [int(i.strip()) for i in result_list_str.split(",")]
-            if len(result_list) < _MIN_STATUS_VALUES:
-                raise ValueError(
-                    f"status payload has {len(result_list)} values, "
-                    f"expected at least {_MIN_STATUS_VALUES}"
-                )
+    def _needs_new_token(self, error):
+        """Note a request outcome and return whether to refresh the token.
 
-            fan_mode_id = result_list[0]
-            hvac_mode_id = result_list[4]
-            swing_mode_id = result_list[209]
-            if fan_mode_id not in self.fan_mode_lookup:
-                raise ValueError(f"unknown fan mode id {fan_mode_id}")
-            if hvac_mode_id not in self.hvac_mode_lookup:
-                raise ValueError(f"unknown hvac mode id {hvac_mode_id}")
-            if swing_mode_id not in _STATUS_SWING_MODES:
-                raise ValueError(f"unknown swing mode id {swing_mode_id}")
-
-            status = {
-                "desired_temperature": result_list[9],
-                "indoor_temperature": result_list[10],
-                "hvac_mode_id": hvac_mode_id,
-                "hvac_mode": self.hvac_mode_lookup[hvac_mode_id],
-                "fan_mode_id": fan_mode_id,
-                "fan_mode": self.fan_mode_lookup[fan_mode_id],
-                "screen_on": result_list[58] == 1,
-                "power_on": result_list[5] == 1,
-                "aux_heat": result_list[45] == 1,
-                "nature_wind": result_list[44] == 1,
-                "swing_mode_id": swing_mode_id,
-            }
-        except (IndexError, TypeError, ValueError):
-            _LOGGER.error("Failed to parse Hisense status response", exc_info=True)
+        AUTH always refreshes. The cloud may also reject a token inside the
+        body with an undocumented resultCode, so FAILED refreshes at most once
+        per FAILED_REFRESH_INTERVAL. A token not yet seen working, such as one
+        restored from storage, is refreshed once on its first failure.
+        """
+        if error is None:
+            self.access_token_verified = True
             return False
-
-        self.status.update(status)
-        return True
-
-    async def _send_command_and_update_status(self, url, command_data):
-        result = await self._robust_send_command(
-            url,
-            command_data,
-            status_required=False,
-        )
-        if result is True:
+        if error.refreshes_token:
             return True
-        if result is None:
-            return bool(await self.check_status())
+        if not self.access_token_verified:
+            self.access_token_verified = True
+            return True
+        if error is RequestError.FAILED:
+            now = time.monotonic()
+            if (
+                self._failed_refresh_at is None
+                or now - self._failed_refresh_at >= FAILED_REFRESH_INTERVAL
+            ):
+                self._failed_refresh_at = now
+                return True
         return False
 
-    async def turn_on(self):
-        command_data = deepcopy(self.power_data_template)
-        command_data["attributes"] = "{\"onAndOff\":\"On\"}"
-        return await self._send_command_and_update_status(self.power_url, command_data)
-
-    async def turn_off(self):
-        command_data = deepcopy(self.power_data_template)
-        command_data["attributes"] = "{\"onAndOff\":\"Off\"}"
-        return await self._send_command_and_update_status(self.power_url, command_data)
-
-    async def send_logic_command(self, id: int, param: int):
-        command_data = deepcopy(self.command_data_template)
-        command_data["cmdList"] = [
-            {"cmdId": id, "cmdOrder": 0, "cmdParm": param, "delayTime": 0}
-        ]
-        return await self._send_command_and_update_status(self.command_url, command_data)
+    def _record(self, endpoint, elapsed, ok, result_code=None, error=None):
+        self.metrics.record(endpoint, elapsed, ok, result_code, error)
 
-    async def check_status(self):
-        if await self._robust_send_command(self.check_url, self.check_data_template):
-            return self.get_status()
-        return None
+    async def _post(self, url, body, endpoint, label):
+        """POST an encoded ``body`` to ``url`` and return ``(result, error)``.
 
-    def get_status(self):
-        return dict(self.status)
+        ``result`` is the decoded response when the cloud accepted the request
+        and None otherwise, with ``error`` the RequestError saying why. The
+        outcome is recorded under ``endpoint`` and failures are logged with
+        ``label``.
+        """
+        started = time.monotonic()
+        result = None
+        try:
+            async with self.session.post(url, headers=self.HEADERS, data=body) as response:
+                error = _classify_http_status(response.status)
+                body = await response.read()
+        except Exception:
+            self._record(endpoint, time.monotonic() - started, False, error=RequestError.TRANSPORT)
+            _LOGGER.error("Hisense %s request failed", label, exc_info=True)
+            return None, RequestError.TRANSPORT
 
-    async def refresh(self):
+        if error is None:
+            # An undecodable body is MALFORMED, not a transport failure, so it
+            # does not trip the circuit breaker; it is logged as is.
+            try:
+                result = _decode_json(body)
+            except ValueError:
+                result = body
+            error = _classify_response(result)
+        result_code = _result_code(result)
+        self._record(endpoint, time.monotonic() - started, error is None, result_code, error)
+        if error is RequestError.MALFORMED:
+            _LOGGER.error("Hisense %s response is malformed: %s", label, result)
+            return None, error
+        if error is not None:
+            _LOGGER.warning(
+                "Hisense %s request failed (%s) with resultCode=%s",
+                label,
+                error.value,
+                result_code,
+            )
+            return None, error
+        return result, None
+
+    async def _request_access_token(self, label):
+        """Ask the cloud for a new access token; return it, or None on failure."""
         refresh_data = {
             'refreshToken': self.refresh_token,
             'appKey': "1234567890",
             'format': '1',
         }
+        started = time.monotonic()
         try:
             async with self.session.post(self.refresh_url,
-                                         headers=self.refresh_headers,
+                                         headers=self.REFRESH_HEADERS,
                                          data=refresh_data) as response:
-                result = await response.json()
-                if not isinstance(result, list) or not result:
-                    _LOGGER.error("Hisense token refresh returned unexpected body: %s", result)
-                    return False
-                token = result[0].get("token") if isinstance(result[0], dict) else None
-                if not token:
-                    _LOGGER.error("Hisense token refresh response did not include token")
-                    return False
-                self.access_token = token
-                _LOGGER.debug(f"Get access token: {self.access_token}")
-                return True
+                body = await response.read()
         except Exception:
-            _LOGGER.error("Failed to refresh token", exc_info=True)
-            return False
-
+            self._record("refresh", time.monotonic() - started, False)
+            _LOGGER.error("Failed to refresh Hisense %s token", label, exc_info=True)
+            return None
+        try:
+            result = _decode_json(body)
+        except ValueError:
+            result = body
+        token = None
+        if isinstance(result, list) and result and isinstance(result[0], dict):
+            token = result[0].get("token")
+        self._record("refresh", time.monotonic() - started, bool(token))
+        if not isinstance(result, list) or not result:
+            _LOGGER.error("Hisense %s token refresh returned unexpected body: %s", label, result)
+            return None
+        if not token:
+            _LOGGER.error("Hisense %s token refresh response did not include token", label)
+            return None
+        return token
+
+
+class HiSenseClient(_CloudRequester):
+    """Request, token and status handling shared by the Hisense device clients.
+
+    Request bodies are encoded once per device: the status check body is
+    fixed, power commands only choose between two bodies and logic commands
+    append the encoded ``cmdList`` to a pre-encoded prefix.
+    """
+
+    HEADERS = {
+        'Host': 'api-wg.hismarttv.com',
+        'Content-Type': 'application/json',
+        'Connection': 'keep-alive',
+        'Accept': '*/*',
+        'User-Agent': _USER_AGENT,
+        'Accept-Language': 'zh-CN,zh-Hans;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+    }
+    REFRESH_HEADERS = {
+        'Host': 'bas-wg.hismarttv.com',
+        'Content-Type': 'application/x-www-form-urlencoded',
+        'Connection': 'keep-alive',
+        'Accept': '*/*',
+        'User-Agent': _USER_AGENT,
+        'Accept-Language': 'zh-CN,zh-Hans;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br'
+    }
+    URL_HEAD = "https://api-wg.hismarttv.com/agw/dsg/outer"
+    REFRESH_URL = "https://bas-wg.hismarttv.com/aaa/refresh_token2"
+    # Set by the device clients below.
+    DEVICE_LABEL = "device"
+    STATUS_DECODER = None
+    STATUS_TYPE = DeviceStatus
 
-class HiSenseFridge:
     def __init__(self, wifi_id, device_id, refresh_token, session, device_name="", entity_name=""):
         self.wifi_id = wifi_id
         self.device_id = device_id
         self.refresh_token = refresh_token
         self.access_token = None
+        self.access_token_verified = True
+        self._failed_refresh_at = None
+        self.account = None
+        self.metrics = RequestMetrics()
+        # Replaced by the account's breaker when the client joins an account.
+        self.breaker = CircuitBreaker()
+        # Set to the account's scheduler when the client joins an account.
+        self.scheduler = None
+        # (time, raw deviceStatus) of the latest status payloads, for diagnostics.
+        self.payload_history = deque(maxlen=HISTORY_SIZE)
+        self._last_payload = None
+        self._check_task = None
+        self.status_fetched_at = None
         self.session = session
         self.device_name = device_name
         self.entity_name = entity_name
-        app_name_encoding = "%E6%B5%B7%E4%BF%A1%E6%99%BA%E6%85%A7%E5%AE%B6"
-        self.headers = {
-            'Host': 'api-wg.hismarttv.com',
-            'Content-Type': 'application/json',
-            'Connection': 'keep-alive',
-            'Accept': '*/*',
-            'User-Agent': f"{app_name_encoding}/4 CFNetwork/1492.0.1 Darwin/23.3.0",
-            'Accept-Language': 'zh-CN,zh-Hans;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-        }
-        self.refresh_headers = {
-            'Host': 'bas-wg.hismarttv.com',
-            'Content-Type': 'application/x-www-form-urlencoded',
-            'Connection': 'keep-alive',
-            'Accept': '*/*',
-            'User-Agent': f"{app_name_encoding}/4 CFNetwork/1492.0.1 Darwin/23.3.0",
-            'Accept-Language': 'zh-CN,zh-Hans;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br'
-        }
-        self.url_head = "https://api-wg.hismarttv.com/agw/dsg/outer"
+        self.url_head = self.URL_HEAD
         self.power_url = f"{self.url_head}/sendDeviceModelCmd?accessToken="
         self.command_url = f"{self.url_head}/uploadRemoteLogicCmd?accessToken="
         self.check_url = f"{self.url_head}/getDeviceLogicalStatusArray?accessToken="
-        self.refresh_url = "https://bas-wg.hismarttv.com/aaa/refresh_token2"
-        self.power_data_template = {
+        self.refresh_url = self.REFRESH_URL
+        self._check_body = _json_dumps(
+            {"deviceList": [{"wifiId": wifi_id, "deviceId": device_id}]}
+        )
+        power_data = {
             "wifiId": wifi_id,
             "deviceId": device_id,
             "extendParam": "1",
             "cmdVersion": "0",
         }
-        self.check_data_template = {
-            "deviceList": [
-                {
-                    "wifiId": wifi_id,
-                    "deviceId": device_id,
-                }
-            ]
+        self._power_bodies = {
+            True: _json_dumps({**power_data, "attributes": "{\"onAndOff\":\"On\"}"}),
+            False: _json_dumps({**power_data, "attributes": "{\"onAndOff\":\"Off\"}"}),
         }
-        self.command_data_template = {
+        command_data = {
             "wifiId": wifi_id,
             "deviceId": device_id,
             "extendParm": "1",
             "cmdVersion": "1684085201",
         }
-        self.status = {
-            "power_on": False,
-            "refrigerator_set_temperature": 5,
-            "freeze_set_temperature": -18,
-            "refrigerator_real_temperature": 5,
-            "freeze_real_temperature": -18,
-            "variation_real_temperature": 0,
-            "ambient_temperature": 25,
-            "work_mode_id": 0,
-            "work_mode": "自定义",
-            "variation_mode_id": 0,
-            "variation_mode": "NORMAL",
-        }
-        self.work_mode_lookup = {
-            0: "自定义",
-            64: "智能",
-            65: "速冷",
-        }
-        self.variation_mode_lookup = {
-            16: "原鲜",
-            32: "0℃养鲜",
-            64: "母婴",
-        }
+        # Everything up to the cmdList value: b'{...,"cmdList":'.
+        self._command_body_prefix = _json_dumps(command_data)[:-1] + b',"cmdList":'
+        # Replaced, never mutated, so readers can keep a reference to it.
+        self.status = self.STATUS_TYPE()
+
+    def _endpoint_for(self, url):
+        if url == self.check_url:
+            return "check"
+        if url == self.power_url:
+            return "power_command"
+        return "logic_command"
+
+    def _power_body(self, power_on):
+        return self._power_bodies[bool(power_on)]
+
+    def _command_body(self, commands):
+        """Encode a logic command request for ``(cmd_id, param[, delay_time])`` tuples."""
+        cmd_list = [
+            {
+                "cmdId": command[0],
+                "cmdOrder": order,
+                "cmdParm": command[1],
+                "delayTime": command[2] if len(command) > 2 else 0,
+            }
+            for order, command in enumerate(commands)
+        ]
+        return self._command_body_prefix + _json_dumps(cmd_list) + b"}"
+
+    async def _send_request(self, url, command_data, status_required=True):
+        """Send one request and return ``(result, error)``.
+
+        ``command_data`` is an encoded body or a dict to encode. ``result`` is
+        True when the status was updated, None when the request was accepted
+        without a status and ``status_required`` is off, and False on failure,
+        with ``error`` the RequestError saying why.
+        """
+        request = partial(self._post_request, url, command_data, status_required)
+        if self.scheduler is None:
+            return await request()
+        if url == self.check_url:
+            return await self.scheduler.run(
+                RequestScheduler.POLL, request, key=("check", self.device_id)
+            )
+        return await self.scheduler.run(RequestScheduler.COMMAND, request)
+
+    async def _post_request(self, url, command_data, status_required):
+        if not isinstance(command_data, bytes):
+            command_data = _json_dumps(command_data)
+        result, error = await self._post(
+            f"{url}{self.access_token}",
+            command_data,
+            self._endpoint_for(url),
+            self.DEVICE_LABEL,
+        )
+        if error is not None:
+            return False, error
 
-    async def _send_command(self, url, command_data, status_required=True):
-        post_url = f"{url}{self.access_token}"
         try:
-            async with self.session.post(
-                post_url,
-                headers=self.headers,
-                json=command_data,
-            ) as response:
-                result = await response.json()
-        except Exception:
-            _LOGGER.error("Hisense fridge request failed", exc_info=True)
-            return False
-
-        if not isinstance(result, dict):
-            _LOGGER.error("Hisense fridge response is not an object: %s", result)
-            return False
-
-        response_obj = result.get("response")
-        if not isinstance(response_obj, dict):
-            _LOGGER.error("Hisense fridge response missing response object: %s", result)
-            return False
-
-        result_code = response_obj.get("resultCode")
-        if result_code != 0:
-            _LOGGER.warning("Hisense fridge request failed with resultCode=%s", result_code)
-            return False
-
-        if not status_required:
-            try:
-                self._extract_status_payload(result)
-            except ValueError:
-                _LOGGER.debug("Hisense fridge response accepted without status payload")
-                return None
+            payload = self._extract_status_payload(result)
+        except ValueError:
+            if not status_required:
+                _LOGGER.debug(
+                    "Hisense %s response accepted without status payload", self.DEVICE_LABEL
+                )
+                return None, None
+            payload = None
 
-        if self._update_status_from_result(result):
-            return True
+        if payload is not None and self._update_status_from_payload(payload):
+            return True, None
 
         if not status_required:
-            return None
+            return None, None
 
-        _LOGGER.error("Hisense fridge response did not include a usable status payload")
-        return False
+        _LOGGER.error(
+            "Hisense %s response did not include a usable status payload", self.DEVICE_LABEL
+        )
+        return False, RequestError.MALFORMED
 
     async def _robust_send_command(self, url, command_data, status_required=True):
-        result = await self._send_command(url, command_data, status_required)
-        if result is not False:
+        breaker = self.breaker
+        if not breaker.allow_request():
+            _LOGGER.debug(
+                "Hisense cloud circuit breaker open, skipping %s request for %.0fs",
+                self.DEVICE_LABEL,
+                breaker.retry_after,
+            )
+            return False
+        access_token = self.access_token
+        result, error = await self._send_request(url, command_data, status_required)
+        breaker.record(error)
+        # The account holds the token shared by its clients.
+        tokens = self.account if self.account is not None else self
+        # Only errors a new token may fix are retried; the rest fail right away.
+        if not tokens._needs_new_token(error):
             return result
-        _LOGGER.info("Attempting to refresh token and retry fridge command")
-        if not await self.refresh():
-            _LOGGER.error("Failed to refresh fridge token")
+        _LOGGER.info("Attempting to refresh token and retry %s command", self.DEVICE_LABEL)
+        if not await self.refresh(stale_token=access_token):
+            breaker.record_failure()
+            _LOGGER.error("Failed to refresh %s token", self.DEVICE_LABEL)
             return False
-        return await self._send_command(url, command_data, status_required)
+        self.metrics.record_retry(self._endpoint_for(url))
+        result, error = await self._send_request(url, command_data, status_required)
+        breaker.record(error)
+        return result
 
     def _extract_status_payload(self, result):
         if not isinstance(result, dict):
@@ -636,37 +1270,25 @@ class HiSenseFridge:
 
         raise ValueError("missing status payload")
 
-    def _update_status_from_result(self, result):
-        try:
-            result_list_str = self._extract_status_payload(result)
-            result_list = [int(i.strip()) for i in result_list_str.split(",")]
-            if len(result_list) < _MIN_FRIDGE_STATUS_VALUES:
-                raise ValueError(
-                    f"status payload has {len(result_list)} values, "
-                    f"expected at least {_MIN_FRIDGE_STATUS_VALUES}"
-                )
+    def decode_status(self, payload):
+        """Decode a raw status payload without applying it."""
+        return self.STATUS_DECODER.decode(payload)
 
-            work_mode_id = result_list[3]
-            variation_mode_id = result_list[130] if len(result_list) > 130 else 0
-
-            status = {
-                "refrigerator_set_temperature": result_list[0],
-                "freeze_set_temperature": result_list[1],
-                "work_mode_id": work_mode_id,
-                "work_mode": self.work_mode_lookup.get(work_mode_id, "自定义"),
-                "power_on": result_list[4] == 1,
-                "refrigerator_real_temperature": result_list[6],
-                "freeze_real_temperature": result_list[7],
-                "variation_real_temperature": result_list[8],
-                "ambient_temperature": result_list[9],
-                "variation_mode_id": variation_mode_id,
-                "variation_mode": self.variation_mode_lookup.get(variation_mode_id, "NORMAL"),
-            }
+    def _update_status_from_payload(self, result_list_str):
+        self.payload_history.append((time.time(), result_list_str))
+        # Most polls return the exact payload already decoded into self.status.
+        if result_list_str == self._last_payload:
+            return True
+        try:
+            status = self.STATUS_TYPE(self.STATUS_DECODER.decode(result_list_str))
         except (IndexError, TypeError, ValueError):
-            _LOGGER.error("Failed to parse Hisense fridge status response", exc_info=True)
+            _LOGGER.error(
+                "Failed to parse Hisense %s status response", self.DEVICE_LABEL, exc_info=True
+            )
             return False
 
-        self.status.update(status)
+        self.status = status
+        self._last_payload = result_list_str
         return True
 
     async def _send_command_and_update_status(self, url, command_data):
@@ -682,21 +1304,90 @@ class HiSenseFridge:
         return False
 
     async def turn_on(self):
-        command_data = deepcopy(self.power_data_template)
-        command_data["attributes"] = "{\"onAndOff\":\"On\"}"
-        return await self._send_command_and_update_status(self.power_url, command_data)
+        return await self._send_command_and_update_status(
+            self.power_url, self._power_body(True)
+        )
 
     async def turn_off(self):
-        command_data = deepcopy(self.power_data_template)
-        command_data["attributes"] = "{\"onAndOff\":\"Off\"}"
-        return await self._send_command_and_update_status(self.power_url, command_data)
+        return await self._send_command_and_update_status(
+            self.power_url, self._power_body(False)
+        )
 
     async def send_logic_command(self, id: int, param: int):
-        command_data = deepcopy(self.command_data_template)
-        command_data["cmdList"] = [
-            {"cmdId": id, "cmdOrder": 0, "cmdParm": param, "delayTime": 0}
-        ]
-        return await self._send_command_and_update_status(self.command_url, command_data)
+        return await self.send_logic_commands([(id, param)])
+
+    async def send_logic_commands(self, commands):
+        """Send several logic commands in one request.
+
+        ``commands`` holds ``(cmd_id, param)`` or ``(cmd_id, param, delay_time)``
+        tuples; the device applies them in list order.
+        """
+        return await self._send_command_and_update_status(
+            self.command_url, self._command_body(commands)
+        )
+
+    async def check_status(self, max_age=None):
+        """Fetch the device status, joining a fetch already in flight.
+
+        With ``max_age`` a status fetched less than that many seconds ago is
+        returned without a new request.
+        """
+        if (
+            max_age is not None
+            and self.status_fetched_at is not None
+            and time.monotonic() - self.status_fetched_at <= max_age
+        ):
+            return self.get_status()
+        if self._check_task is None or self._check_task.done():
+            self._check_task = asyncio.ensure_future(self._check_status())
+        return await asyncio.shield(self._check_task)
+
+    async def _check_status(self):
+        if await self._robust_send_command(self.check_url, self._check_body):
+            self.status_fetched_at = time.monotonic()
+            return self.get_status()
+        return None
+
+    def get_status(self):
+        """Return the latest status snapshot; it is immutable, so it is not copied."""
+        return self.status
+
+    async def refresh(self, stale_token=None):
+        if self.account is not None:
+            if stale_token is None:
+                stale_token = self.access_token
+            # The account records the refresh request and counts the refresh.
+            return await self.account.refresh(stale_token=stale_token)
+        token = await self._request_access_token(self.DEVICE_LABEL)
+        if token is None:
+            return False
+        self.access_token = token
+        self.metrics.record_token_refresh()
+        return True
+
+
+class HiSenseAC(HiSenseClient):
+    DEVICE_LABEL = "AC"
+    STATUS_DECODER = _AC_STATUS_DECODER
+    STATUS_TYPE = ACStatus
+
+    def __init__(self, wifi_id, device_id, refresh_token, session, device_name="", entity_name=""):
+        super().__init__(wifi_id, device_id, refresh_token, session, device_name, entity_name)
+        self.hvac_mode_lookup = _AC_HVAC_MODES
+        self.fan_mode_lookup = _AC_FAN_MODES
+        self.climate_min_temp = 16
+        self.climate_max_temp = 32
+
+
+class HiSenseFridge(HiSenseClient):
+    DEVICE_LABEL = "fridge"
+    STATUS_DECODER = _FRIDGE_STATUS_DECODER
+    STATUS_TYPE = FridgeStatus
+
+    def __init__(self, wifi_id, device_id, refresh_token, session, device_name="", entity_name=""):
+        super().__init__(wifi_id, device_id, refresh_token, session, device_name, entity_name)
+        self.work_mode_lookup = _FRIDGE_WORK_MODES
+        self.variation_mode_lookup = _FRIDGE_VARIATION_MODES
 
     async def set_refrigerator_temperature(self, temperature: int):
         return await self.send_logic_command(1, temperature)
@@ -723,35 +1414,202 @@ class HiSenseFridge:
             return await self.send_logic_command(35, 1)
         return False
 
-    async def check_status(self):
-        if await self._robust_send_command(self.check_url, self.check_data_template):
-            return self.get_status()
-        return None
 
-    def get_status(self):
-        return dict(self.status)
+class HiSenseAccount(_CloudRequester):
+    """Shared token holder and batch status poller for one Hisense account."""
 
-    async def refresh(self):
-        refresh_data = {
-            'refreshToken': self.refresh_token,
-            'appKey': "1234567890",
-            'format': '1',
-        }
-        try:
-            async with self.session.post(self.refresh_url,
-                                         headers=self.refresh_headers,
-                                         data=refresh_data) as response:
-                result = await response.json()
-                if not isinstance(result, list) or not result:
-                    _LOGGER.error("Hisense fridge token refresh returned unexpected body: %s", result)
-                    return False
-                token = result[0].get("token") if isinstance(result[0], dict) else None
-                if not token:
-                    _LOGGER.error("Hisense fridge token refresh response did not include token")
-                    return False
-                self.access_token = token
-                _LOGGER.debug(f"Get fridge access token: {self.access_token}")
-                return True
-        except Exception:
-            _LOGGER.error("Failed to refresh fridge token", exc_info=True)
+    HEADERS = HiSenseClient.HEADERS
+    REFRESH_HEADERS = HiSenseClient.REFRESH_HEADERS
+
+    def __init__(self, session, refresh_token):
+        self.session = session
+        self.refresh_token = refresh_token
+        self.access_token = None
+        self.access_token_issued_at = None
+        self.access_token_verified = True
+        self._failed_refresh_at = None
+        self.clients = {}
+        self.metrics = RequestMetrics()
+        self.breaker = CircuitBreaker()
+        self.scheduler = RequestScheduler()
+        self._check_task = None
+        self._refresh_task = None
+        self._token_listeners = []
+        # Encoded batch status body, rebuilt when a client is added.
+        self._check_body = None
+        self.refresh_url = HiSenseClient.REFRESH_URL
+
+    def add_client(self, client):
+        self.clients[client.device_id] = client
+        self._check_body = None
+        client.account = self
+        client.metrics.parent = self.metrics
+        client.breaker = self.breaker
+        client.scheduler = self.scheduler
+        if self.access_token is not None:
+            client.access_token = self.access_token
+
+    def add_token_listener(self, listener):
+        """Call ``listener(access_token, issued_at)`` after every token refresh."""
+        self._token_listeners.append(listener)
+
+    def set_access_token(self, access_token, issued_at=None, verified=True):
+        """Install an access token on every client.
+
+        A token restored from storage is passed with ``verified`` off, so the
+        first request that fails with it refreshes it whatever the error.
+        """
+        self.access_token = access_token
+        self.access_token_issued_at = time.time() if issued_at is None else issued_at
+        self.access_token_verified = verified
+        for client in self.clients.values():
+            client.access_token = access_token
+
+    async def refresh(self, stale_token=None):
+        """Refresh the shared access token, joining a refresh already in flight.
+
+        ``stale_token`` is the token a failed request was sent with; when it has
+        already been replaced no new refresh is started.
+        """
+        if (
+            stale_token is not None
+            and self.access_token is not None
+            and stale_token != self.access_token
+        ):
+            return True
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(
+                self.scheduler.run(RequestScheduler.REFRESH, self._refresh)
+            )
+        return await asyncio.shield(self._refresh_task)
+
+    async def _refresh(self):
+        token = await self._request_access_token("account")
+        if token is None:
             return False
+        self.set_access_token(token)
+        self.metrics.record_token_refresh()
+        _LOGGER.debug("Refreshed access token for %s device(s)", len(self.clients))
+        for listener in self._token_listeners:
+            listener(token, self.access_token_issued_at)
+        return True
+
+    async def check_all(self, max_age=None):
+        """Refresh the status of every client, joining a batch already in flight.
+
+        Returns the set of device ids whose status was updated. With
+        ``max_age``, when every client's status was fetched less than that many
+        seconds ago their ids are returned without a new request.
+        """
+        if max_age is not None and self.clients:
+            now = time.monotonic()
+            if all(
+                client.status_fetched_at is not None
+                and now - client.status_fetched_at <= max_age
+                for client in self.clients.values()
+            ):
+                return set(self.clients)
+        if self._check_task is None or self._check_task.done():
+            self._check_task = asyncio.ensure_future(self._check_all())
+        return await asyncio.shield(self._check_task)
+
+    async def _check_all(self):
+        clients = list(self.clients.values())
+        if not clients:
+            return set()
+        if self._check_body is None:
+            self._check_body = _json_dumps(
+                {
+                    "deviceList": [
+                        {"wifiId": client.wifi_id, "deviceId": client.device_id}
+                        for client in clients
+                    ]
+                }
+            )
+        check_data = self._check_body
+        breaker = self.breaker
+        if not breaker.allow_request():
+            _LOGGER.debug(
+                "Hisense cloud circuit breaker open, skipping batch status check for %.0fs",
+                breaker.retry_after,
+            )
+            return set()
+        if self.access_token is None and not await self.refresh():
+            breaker.record_failure()
+            return set()
+        token_client = clients[0]
+        access_token = self.access_token
+        response_obj, error = await self.scheduler.run(
+            RequestScheduler.POLL,
+            partial(self._send_check, token_client, access_token, check_data),
+        )
+        breaker.record(error)
+        if self._needs_new_token(error):
+            _LOGGER.info("Attempting to refresh token and retry batch status check")
+            if not await self.refresh(stale_token=access_token):
+                breaker.record_failure()
+                _LOGGER.error("Failed to refresh token")
+                return set()
+            self._record_check_retry(clients)
+            response_obj, error = await self.scheduler.run(
+                RequestScheduler.POLL,
+                partial(self._send_check, token_client, self.access_token, check_data),
+            )
+            breaker.record(error)
+        if response_obj is None:
+            return set()
+        return self._dispatch_status_list(response_obj, clients)
+
+    def _record(self, endpoint, elapsed, ok, result_code=None, error=None):
+        # One batch request counts once on the account and once per device in it.
+        self.metrics.record(endpoint, elapsed, ok, result_code, error)
+        if endpoint != "check":
+            return
+        for client in self.clients.values():
+            client.metrics.record(endpoint, elapsed, ok, result_code, error, propagate=False)
+
+    def _record_check_retry(self, clients):
+        self.metrics.endpoints["check"].retries += 1
+        for client in clients:
+            client.metrics.endpoints["check"].retries += 1
+
+    async def _send_check(self, token_client, access_token, check_data):
+        """Send the batch status request and return ``(response_obj, error)``."""
+        result, error = await self._post(
+            f"{token_client.check_url}{access_token}", check_data, "check", "batch"
+        )
+        if error is not None:
+            return None, error
+        return result["response"], None
+
+    def _dispatch_status_list(self, response_obj, clients):
+        status_list = response_obj.get("deviceStatusList")
+        if not isinstance(status_list, list):
+            _LOGGER.error("Hisense batch response did not include deviceStatusList")
+            return set()
+
+        by_wifi_id = {client.wifi_id: client for client in clients}
+        fetched_at = time.monotonic()
+        positional = len(status_list) == len(clients)
+        updated = set()
+        for index, entry in enumerate(status_list):
+            if not isinstance(entry, dict):
+                continue
+            device_id = entry.get("deviceId")
+            wifi_id = entry.get("wifiId")
+            if device_id is None and wifi_id is None:
+                # Entries without ids follow the order of the request deviceList.
+                client = clients[index] if positional else None
+            else:
+                client = self.clients.get(device_id) or by_wifi_id.get(wifi_id)
+            device_status = entry.get("deviceStatus")
+            if client is None or not isinstance(device_status, str) or not device_status:
+                continue
+            if client._update_status_from_payload(device_status):
+                client.status_fetched_at = fetched_at
+                updated.add(client.device_id)
+
+        missing = len(clients) - len(updated)
+        if missing:
+            _LOGGER.debug("Hisense batch response had no usable status for %s device(s)", missing)
+        return updated
@@ -1,5 +1,3 @@
-import asyncio
-
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.exceptions import HomeAssistantError
 
@@ -54,7 +52,16 @@ class HisenseFridgeModeSelect(HisenseEntity, SelectEntity):
     entity_description: SelectEntityDescription
 
     def __init__(self, coordinator, description: SelectEntityDescription):
-        super().__init__(coordinator, description.key, description.key, description.icon)
+        mode_key = (
+            "work_mode" if description.key == "work_mode_select" else "variation_mode"
+        )
+        super().__init__(
+            coordinator,
+            description.key,
+            description.key,
+            description.icon,
+            status_keys=(mode_key,),
+        )
         self.entity_description = description
 
     @property
@@ -84,15 +91,14 @@ class HisenseFridgeModeSelect(HisenseEntity, SelectEntity):
             if not success:
                 raise HomeAssistantError("Failed to set Hisense refrigerator work mode")
 
-            self.coordinator.data["work_mode"] = option
-            self.coordinator.data["work_mode_id"] = mode_id
+            changes = {"work_mode": option, "work_mode_id": mode_id}
             
             if option == "智能":
-                self.coordinator.data["refrigerator_set_temperature"] = 5
-                self.coordinator.data["freeze_set_temperature"] = -18
+                changes["refrigerator_set_temperature"] = 5
+                changes["freeze_set_temperature"] = -18
             elif option == "速冷":
-                self.coordinator.data["refrigerator_set_temperature"] = 2
-                self.coordinator.data["freeze_set_temperature"] = -16
+                changes["refrigerator_set_temperature"] = 2
+                changes["freeze_set_temperature"] = -16
         else:
             mode_id = VARIATION_MODE_MAP.get(option)
             if mode_id is None:
@@ -103,10 +109,10 @@ class HisenseFridgeModeSelect(HisenseEntity, SelectEntity):
                     "Failed to set Hisense refrigerator variation mode"
                 )
 
-            self.coordinator.data["variation_mode"] = option
-            self.coordinator.data["variation_mode_id"] = mode_id
-        
-        self.coordinator.async_set_updated_data(self.coordinator.data)
+            changes = {"variation_mode": option, "variation_mode_id": mode_id}
         
-        await asyncio.sleep(5)
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_note_command()
+        self.coordinator.async_set_optimistic(changes)
+
+        id_key = "work_mode_id" if "work_mode_id" in changes else "variation_mode_id"
+        self.hass.async_create_task(self.coordinator.async_confirm({id_key: mode_id}))
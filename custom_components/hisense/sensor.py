@@ -1,9 +1,21 @@
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
-from homeassistant.const import UnitOfTemperature
+from datetime import timedelta
+
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTemperature, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_interval
 
 from .const import DOMAIN
 from .entity import HisenseEntity
 
+# Request metrics change with every request rather than with the device
+# status, so their sensors write state on a timer of their own.
+METRICS_UPDATE_INTERVAL = timedelta(minutes=1)
+
 FRIDGE_SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
     SensorEntityDescription(
         key="refrigerator_set_temperature",
@@ -53,6 +65,47 @@ FRIDGE_SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
     ),
 )
 
+REQUEST_METRIC_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = tuple(
+    SensorEntityDescription(
+        key=key,
+        translation_key=f"{key}_requests",
+        icon="mdi:cloud-sync",
+        native_unit_of_measurement="requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    )
+    for key in ("check", "logic_command", "power_command")
+) + (
+    SensorEntityDescription(
+        key="token_refreshes",
+        translation_key="token_refreshes",
+        icon="mdi:key-change",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key="request_latency",
+        translation_key="request_latency",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+)
+
+ACCOUNT_REQUEST_RATE_DESCRIPTION = SensorEntityDescription(
+    key="requests_per_minute",
+    translation_key="account_requests_per_minute",
+    icon="mdi:speedometer",
+    native_unit_of_measurement="requests/min",
+    state_class=SensorStateClass.MEASUREMENT,
+    entity_category=EntityCategory.DIAGNOSTIC,
+    entity_registry_enabled_default=False,
+)
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     coordinators = hass.data[DOMAIN][config_entry.entry_id]
@@ -67,6 +120,24 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     ]
     async_add_entities(sensors)
 
+    metric_sensors = [
+        HisenseRequestMetricSensor(coordinator, desc)
+        for coordinator in coordinators.values()
+        for desc in REQUEST_METRIC_DESCRIPTIONS
+    ]
+    # The account-level rate is shown once, on the first device of each account.
+    accounts = set()
+    for coordinator in coordinators.values():
+        account = coordinator.account
+        if account is not None and id(account) in accounts:
+            continue
+        if account is not None:
+            accounts.add(id(account))
+        metric_sensors.append(
+            HisenseRequestMetricSensor(coordinator, ACCOUNT_REQUEST_RATE_DESCRIPTION)
+        )
+    async_add_entities(metric_sensors)
+
 
 class HisenseFridgeSensor(HisenseEntity, SensorEntity):
     entity_description: SensorEntityDescription
@@ -77,6 +148,7 @@ class HisenseFridgeSensor(HisenseEntity, SensorEntity):
             description.key,
             description.key,
             description.icon,
+            status_keys=(description.key,),
         )
         self.entity_description = description
 
@@ -87,3 +159,58 @@ class HisenseFridgeSensor(HisenseEntity, SensorEntity):
     @property
     def native_value(self):
         return self.status.get(self.entity_description.key)
+
+
+class HisenseRequestMetricSensor(HisenseEntity, SensorEntity):
+    """Diagnostic request metrics of a device or of its account."""
+
+    entity_description: SensorEntityDescription
+    # Written on a timer of its own, not on status changes.
+    _status_keys = ()
+
+    def __init__(self, coordinator, description: SensorEntityDescription):
+        super().__init__(
+            coordinator,
+            f"request_metrics_{description.key}",
+            f"request_metrics_{description.key}",
+        )
+        self.entity_description = description
+
+    @property
+    def metrics(self):
+        # The access token and the request budget are shared by the account.
+        if (
+            self.entity_description.key in ("requests_per_minute", "token_refreshes")
+            and self.coordinator.account is not None
+        ):
+            return self.coordinator.account.metrics
+        return self.client.metrics
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @property
+    def native_value(self):
+        key = self.entity_description.key
+        metrics = self.metrics
+        if key in metrics.endpoints:
+            return metrics.endpoints[key].requests
+        if key == "token_refreshes":
+            return metrics.token_refreshes
+        if key == "request_latency":
+            latency = metrics.average_latency
+            return None if latency is None else round(latency * 1000, 1)
+        return metrics.requests_per_minute()
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass, self._async_write_metrics, METRICS_UPDATE_INTERVAL
+            )
+        )
+
+    @callback
+    def _async_write_metrics(self, _now):
+        self.async_write_ha_state()
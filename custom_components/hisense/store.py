@@ -0,0 +1,122 @@
+"""Persistent cache of Hisense access tokens and device statuses."""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .coordinator import HisenseDataUpdateCoordinator
+from .pyhisenseapi import HiSenseAccount
+
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 5
+
+# A cached token older than this is not reused. A younger one is still only
+# trusted once a request succeeds with it: the first failure refreshes it.
+ACCESS_TOKEN_MAX_AGE = 7 * 24 * 3600
+
+
+def _account_key(refresh_token: str) -> str:
+    """Return a stable key for an account without storing its refresh token twice."""
+    return hashlib.sha256(refresh_token.encode()).hexdigest()[:16]
+
+
+class HisenseStore:
+    """Cache access tokens and device statuses for one config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._data: dict[str, Any] = {"accounts": {}, "statuses": {}}
+
+    async def async_load(self) -> None:
+        """Load cached data from disk."""
+        data = await self._store.async_load()
+        if not isinstance(data, dict):
+            return
+        for section in ("accounts", "statuses"):
+            if isinstance(data.get(section), dict):
+                self._data[section] = data[section]
+
+    async def async_remove(self) -> None:
+        """Delete the cache from disk."""
+        await self._store.async_remove()
+
+    def restore_account(self, account: HiSenseAccount) -> bool:
+        """Install a cached access token on the account if it is recent enough."""
+        cached = self._data["accounts"].get(_account_key(account.refresh_token))
+        if not isinstance(cached, dict):
+            return False
+        access_token = cached.get("access_token")
+        issued_at = cached.get("issued_at")
+        if not isinstance(access_token, str) or not access_token:
+            return False
+        if not isinstance(issued_at, (int, float)):
+            return False
+        if time.time() - issued_at > ACCESS_TOKEN_MAX_AGE:
+            _LOGGER.debug("Cached Hisense access token expired, refreshing on startup")
+            return False
+        account.set_access_token(access_token, issued_at, verified=False)
+        return True
+
+    @callback
+    def async_track_account(self, account: HiSenseAccount) -> None:
+        """Save the account's access token whenever it is refreshed."""
+        key = _account_key(account.refresh_token)
+
+        def _token_refreshed(access_token: str, issued_at: float) -> None:
+            self._data["accounts"][key] = {
+                "access_token": access_token,
+                "issued_at": issued_at,
+            }
+            self._async_schedule_save()
+
+        account.add_token_listener(_token_refreshed)
+
+    def restore_status(self, coordinator: HisenseDataUpdateCoordinator) -> bool:
+        """Show the device's last published status until it is fetched again."""
+        cached = self._data["statuses"].get(coordinator.client.device_id)
+        if not isinstance(cached, dict) or not isinstance(cached.get("status"), dict):
+            return False
+        coordinator.async_restore(cached["status"])
+        return True
+
+    @callback
+    def async_track_status(self, coordinator: HisenseDataUpdateCoordinator) -> CALLBACK_TYPE:
+        """Save the device's status whenever the coordinator publishes a fetched one.
+
+        Optimistic publishes are skipped so a command the device never applied
+        is not shown after a restart.
+        """
+        device_id = coordinator.client.device_id
+
+        @callback
+        def _status_updated() -> None:
+            if (
+                coordinator.data is None
+                or not coordinator.last_update_success
+                or coordinator.optimistic
+            ):
+                return
+            self._data["statuses"][device_id] = {
+                "status": coordinator.data.as_dict(),
+                "updated_at": time.time(),
+            }
+            self._async_schedule_save()
+
+        return coordinator.async_add_listener(_status_updated)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
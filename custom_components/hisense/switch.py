@@ -22,6 +22,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
 class AcScreenSwitch(HisenseEntity, SwitchEntity):
     _attr_translation_key = "screen_panel"
+    _status_keys = ("screen_on",)
 
     def __init__(self, coordinator):
         super().__init__(coordinator, "screen", "screen")
@@ -48,6 +49,7 @@ class AcScreenSwitch(HisenseEntity, SwitchEntity):
 
 class AuxHeatSwitch(HisenseEntity, SwitchEntity):
     _attr_translation_key = "auxiliary_heat"
+    _status_keys = ("aux_heat",)
 
     def __init__(self, coordinator):
         super().__init__(coordinator, "aux_heat", "aux_heat")